@@ -1,34 +1,25 @@
-import numpy as np
+from dataclasses import replace
 
+from pysep.fluid_presets import GAS_DEMISTER, OIL_STD, WAT_STD
 from pysep.fluids import liquid_props
-from pysep.separator import SepTwoPhase
-
-oil_props = {
-    "mass_flow": 3.509e5,  # lbm/hr, 25 MBOPD
-    "density": 59.42,  # lbm/ft3, 350 PSIG and 95 deg F
-    "viscosity": 152,  # centipoise
-    "drop_io": np.nan,
-    "drop_iw": 200,  # micron, smallest oil droplet to be removed from water
-    "drop_ig": 100,  # micron, oil in gas, 140 and below can be caught by demister pad
-}
-
-wat_props = {
-    "mass_flow": 1.482e6,  # lbm/hr, 100 MBWPD
-    "density": 62.46,  # lbm/ft3, 350 PSIG and 95 deg F
-    "viscosity": 0.75,  # centipoise
-    "drop_io": 500,  # micron, smallest droplet to be removed in the process
-    "drop_iw": np.nan,
-    "drop_ig": 100,  # micron, water in gas, 140 and below can be caught by demister pad
-}
-
-gas_props = {
-    "mass_flow": (75 / 40) * 7.775e4,  # lbm/hr, 40 MMSCFD
-    "density": 1.151,  # lbm/ft3
-    "viscosity": 1.24e-2,  # centipoise
-    "drop_io": 140,  # micron, smallest droplet to be removed in the process, 140 can be caught by demister
-    "drop_iw": 140,  # micron, smallest droplet to be removed
-    "drop_ig": np.nan,
-}
+from pysep.separator import make_two_phase
+
+oil_props = replace(
+    OIL_STD,
+    mass_flow=3.509e5,  # lbm/hr, 25 MBOPD
+    density=59.42,  # lbm/ft3, 350 PSIG and 95 deg F
+    viscosity=152,  # centipoise
+)
+
+# WAT_STD density 62.46 lbm/ft3, 350 PSIG and 95 deg F
+wat_props = replace(WAT_STD, mass_flow=1.482e6)  # lbm/hr, 100 MBWPD
+
+gas_props = replace(
+    GAS_DEMISTER,
+    mass_flow=(75 / 40) * 7.775e4,  # lbm/hr, 40 MMSCFD
+    density=1.151,  # lbm/ft3
+    viscosity=1.24e-2,  # centipoise
+)
 
 # degasser dimensions
 vid = 10.5  # feet, this is probably the OD, not the ID
@@ -39,7 +30,7 @@ hgas = vid - hliq
 
 liq_props = liquid_props(oil_props, wat_props)
 
-degasser = SepTwoPhase(vid, lss, leff, hliq, liq_props, gas_props)
+degasser = make_two_phase(vid, lss, leff, hliq, liq_props, gas_props)
 print(degasser)
 degasser.results()
 
@@ -49,4 +40,4 @@ bare_wgt = degasser.weight_bare(wall_thk)
 xtra_wgt = 25000  # lbm, weight of vessel internals and nozzles
 vssl_wgt = bare_wgt + xtra_wgt
 
-print(f"Degasser MAWP: {mawp} psig, Wall Thick: {round(wall_thk, 2)} inches, Weight: {round(vssl_wgt/2000, 2)} tons\n")
+print(f"Degasser MAWP: {mawp} psig, Wall Thick: {wall_thk:.2f} inches, Weight: {vssl_wgt / 2000:.2f} tons\n")
@@ -0,0 +1,19 @@
+"""Optional Numba Compilation
+
+Numba is not required to run pysep. When it is installed the scalar kernels are
+compiled in nopython mode, otherwise the decorators hand back the plain python function.
+"""
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # numba is optional
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand in for numba.njit, returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
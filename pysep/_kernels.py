@@ -0,0 +1,238 @@
+"""Compiled Sizing Kernels for the Separator Classes
+
+The numeric part of SepTwoPhase.__init__ and SepThreePhase.__init__ as single
+functions of floats, so numba can compile the geometry, flow and droplet
+calculations into one call. The explicit signatures compile at import and
+cache=True keeps the compiled code on disk between runs. Without numba these
+run as plain python.
+"""
+
+import numpy as np
+
+from pysep._jit import njit, prange
+from pysep.drops import _MICRON_PER_FT, droplet_diameter, velocity_terminal
+from pysep.fluids import _INV_60, _INV_3600
+from pysep.geometry import _area_three_phase, _area_two_phase, _dhyd_three_phase, _dhyd_two_phase
+
+
+def _sig(n_out: int, n_in: int) -> str:
+    """Numba signature of n_in float64 arguments returning a tuple of n_out float64"""
+    return f"UniTuple(f8, {n_out})({', '.join(['f8'] * n_in)})"
+
+
+@njit(_sig(9, 13), cache=True)
+def _two_phase_core(
+    vid: float,
+    r: float,
+    atot: float,
+    pm_tot: float,
+    leff: float,
+    hliq: float,
+    mf_liq: float,
+    rho_liq: float,
+    mu_liq: float,
+    mf_gas: float,
+    rho_gas: float,
+    mu_gas: float,
+    g: float,
+) -> tuple[float, float, float, float, float, float, float, float, float]:
+    """Two Phase Separator Sizing
+
+    Args:
+        vid (float): Vessel Inner Diameter, feet
+        r (float): Vessel Inner Radius, feet
+        atot (float): Total Cross Sectional Area, ft2
+        pm_tot (float): Total Perimeter, ft
+        leff (float): Vessel Effective Length, feet
+        hliq (float): Height of the Liquid in Vessel, feet
+        mf_liq (float): Liquid Mass Flow, lbm/hr
+        rho_liq (float): Liquid Density, lbm/ft3
+        mu_liq (float): Liquid Viscosity, lbm/(ft*s)
+        mf_gas (float): Gas Mass Flow, lbm/hr
+        rho_gas (float): Gas Density, lbm/ft3
+        mu_gas (float): Gas Viscosity, lbm/(ft*s)
+        g (float): Gravity Acceleration, ft/s2
+
+    Returns:
+        aliq, agas (float): Areas, ft2
+        vx_liq, vx_gas (float): Horizontal Velocities, ft/s
+        ret_liq, ret_gas (float): Retention Times, minutes
+        re_liq, re_gas (float): Reynolds Numbers, unitless
+        drop_liq (float): Smallest Liquid Droplet Removed from the Gas, micron
+    """
+    aliq, agas = _area_two_phase(vid, r, atot, hliq)
+    dhyd_liq, dhyd_gas = _dhyd_two_phase(vid, r, atot, pm_tot, hliq)
+
+    vx_liq = mf_liq * _INV_3600 / (rho_liq * aliq)  # ft/s
+    vx_gas = mf_gas * _INV_3600 / (rho_gas * agas)
+
+    ret_liq = leff / vx_liq * _INV_60  # minutes
+    ret_gas = leff / vx_gas * _INV_60
+
+    re_liq = rho_liq * vx_liq * dhyd_liq / mu_liq
+    re_gas = rho_gas * vx_gas * dhyd_gas / mu_gas
+
+    vt_gas_req = (vid - hliq) * vx_gas / leff  # gas height / (ret * 60), smallest droplet out of gravity
+    drop_liq = droplet_diameter(vt_gas_req, rho_liq, rho_gas, mu_gas, g) * _MICRON_PER_FT  # micron
+
+    return aliq, agas, vx_liq, vx_gas, ret_liq, ret_gas, re_liq, re_gas, drop_liq
+
+
+@njit(_sig(15, 17), cache=True)
+def _three_phase_core(
+    vid: float,
+    r: float,
+    atot: float,
+    pm_tot: float,
+    leff: float,
+    hoil: float,
+    hwat: float,
+    mf_oil: float,
+    rho_oil: float,
+    mu_oil: float,
+    mf_wat: float,
+    rho_wat: float,
+    mu_wat: float,
+    mf_gas: float,
+    rho_gas: float,
+    mu_gas: float,
+    g: float,
+) -> tuple[float, ...]:
+    """Three Phase Separator Sizing
+
+    Args:
+        vid (float): Vessel Inner Diameter, feet
+        r (float): Vessel Inner Radius, feet
+        atot (float): Total Cross Sectional Area, ft2
+        pm_tot (float): Total Perimeter, ft
+        leff (float): Vessel Effective Length, feet
+        hoil (float): Height of the Oil in Vessel, feet
+        hwat (float): Height of the Water in Vessel, feet
+        mf_oil, mf_wat, mf_gas (float): Mass Flows, lbm/hr
+        rho_oil, rho_wat, rho_gas (float): Densities, lbm/ft3
+        mu_oil, mu_wat, mu_gas (float): Viscosities, lbm/(ft*s)
+        g (float): Gravity Acceleration, ft/s2
+
+    Returns:
+        aoil, awat, agas (float): Areas, ft2
+        vx_oil, vx_wat, vx_gas (float): Horizontal Velocities, ft/s
+        ret_oil, ret_wat, ret_gas (float): Retention Times, minutes
+        re_oil, re_wat, re_gas (float): Reynolds Numbers, unitless
+        drop_oiw, drop_wio, drop_oig (float): Smallest Droplets Removed, micron
+    """
+    aoil, awat, agas = _area_three_phase(vid, r, atot, hoil, hwat)
+    dhyd_oil, dhyd_wat, dhyd_gas = _dhyd_three_phase(vid, r, atot, pm_tot, hoil, hwat)
+
+    vx_oil = mf_oil * _INV_3600 / (rho_oil * aoil)  # ft/s
+    vx_wat = mf_wat * _INV_3600 / (rho_wat * awat)
+    vx_gas = mf_gas * _INV_3600 / (rho_gas * agas)
+
+    ret_oil = leff / vx_oil * _INV_60  # minutes
+    ret_wat = leff / vx_wat * _INV_60
+    ret_gas = leff / vx_gas * _INV_60
+
+    re_oil = rho_oil * vx_oil * dhyd_oil / mu_oil
+    re_wat = rho_wat * vx_wat * dhyd_wat / mu_wat
+    re_gas = rho_gas * vx_gas * dhyd_gas / mu_gas
+
+    # terminal velocity required to cross the phase in its retention time, dh / (ret * 60) = dh * vx / leff
+    vt_oiw_req = hwat * vx_wat / leff  # oil in water
+    vt_wio_req = (hoil - hwat) * vx_oil / leff  # water in oil, across the oil height
+    vt_oig_req = (vid - hoil) * vx_gas / leff  # oil in gas, across the gas height
+
+    drop_oiw = droplet_diameter(vt_oiw_req, rho_oil, rho_wat, mu_wat, g) * _MICRON_PER_FT  # micron
+    drop_wio = droplet_diameter(vt_wio_req, rho_wat, rho_oil, mu_oil, g) * _MICRON_PER_FT
+    drop_oig = droplet_diameter(vt_oig_req, rho_oil, rho_gas, mu_gas, g) * _MICRON_PER_FT
+
+    return (
+        aoil,
+        awat,
+        agas,
+        vx_oil,
+        vx_wat,
+        vx_gas,
+        ret_oil,
+        ret_wat,
+        ret_gas,
+        re_oil,
+        re_wat,
+        re_gas,
+        drop_oiw,
+        drop_wio,
+        drop_oig,
+    )
+
+
+@njit(cache=True)
+def _terminal_velocity_array(dm: np.ndarray, rho_drop: float, rho_fld: float, mu_fld: float, g: float) -> np.ndarray:
+    """Terminal Velocity over a 1D Array of Droplets
+
+    velocity_terminal run across the array in one compiled loop.
+
+    Args:
+        dm (np.ndarray): Droplet Diameters, micron
+        rho_drop (float): Droplet Density, lbm/ft3
+        rho_fld (float): Density of Fluid, lbm/ft3
+        mu_fld (float): Viscosity of Fluid, lbm/(ft*s)
+        g (float): Gravity Acceleration, ft/s2
+
+    Returns:
+        vt (np.ndarray): Terminal Velocity of Droplets, ft/s
+    """
+    vt = np.empty(dm.size)
+    for i in range(dm.size):
+        vt[i] = velocity_terminal(dm[i] / _MICRON_PER_FT, rho_drop, rho_fld, mu_fld, g)
+    return vt
+
+
+@njit(parallel=True, cache=True)
+def _three_phase_sweep(
+    vid: np.ndarray,
+    leff: np.ndarray,
+    hoil: np.ndarray,
+    hwat: np.ndarray,
+    mf_oil: float,
+    rho_oil: float,
+    mu_oil: float,
+    mf_wat: float,
+    rho_wat: float,
+    mu_wat: float,
+    mf_gas: float,
+    rho_gas: float,
+    mu_gas: float,
+    g: float,
+) -> np.ndarray:
+    """Three Phase Separator Sizing across 1D Arrays of Vessels
+
+    Every vessel is independent, so the grid points are split across threads
+    with prange. Viscosities are lbm/(ft*s), see _three_phase_core.
+
+    Returns:
+        out (np.ndarray): Shape (N, 15), one _three_phase_core tuple per row
+    """
+    n = vid.size
+    out = np.empty((n, 15))
+    for i in prange(n):
+        r = vid[i] / 2  # radius
+        res = _three_phase_core(
+            vid[i],
+            r,
+            np.pi * r * r,
+            2 * np.pi * r,
+            leff[i],
+            hoil[i],
+            hwat[i],
+            mf_oil,
+            rho_oil,
+            mu_oil,
+            mf_wat,
+            rho_wat,
+            mu_wat,
+            mf_gas,
+            rho_gas,
+            mu_gas,
+            g,
+        )
+        for j in range(15):
+            out[i, j] = res[j]
+    return out
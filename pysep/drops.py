@@ -2,6 +2,12 @@
 
 import math
 
+import numpy as np
+
+from pysep._jit import njit
+
+_MICRON_PER_FT = 304800  # micron in a foot
+
 
 def micron_to_feet(dm: float) -> float:
     """Convert Microns to Feet
@@ -14,7 +20,7 @@ def micron_to_feet(dm: float) -> float:
     Returns:
         df (float): Droplet Diameter, feet
     """
-    return dm / 304800
+    return dm / _MICRON_PER_FT
 
 
 def feet_to_micron(df: float) -> float:
@@ -28,7 +34,7 @@ def feet_to_micron(df: float) -> float:
     Returns:
         dm (float): Droplet Diameter, micron
     """
-    return df * 304800
+    return df * _MICRON_PER_FT
 
 
 def centipoise_to_lbm(mu_cp: float) -> float:
@@ -45,6 +51,7 @@ def centipoise_to_lbm(mu_cp: float) -> float:
     return mu_cp / 1488.2
 
 
+@njit(cache=True)
 def velocity_drop(dd: float, cd: float, rho_drop: float, rho_fld: float, g: float) -> float:
     """Terminal Velocity of a Droplet moving through a Fluid
 
@@ -66,6 +73,7 @@ def velocity_drop(dd: float, cd: float, rho_drop: float, rho_fld: float, g: floa
     return vt
 
 
+@njit(cache=True)
 def diameter_drop(vt: float, cd: float, rho_drop: float, rho_fld: float, g: float) -> float:
     """Droplet Diameter for specified terminal velocity
 
@@ -87,6 +95,7 @@ def diameter_drop(vt: float, cd: float, rho_drop: float, rho_fld: float, g: floa
     return dd
 
 
+@njit(cache=True)
 def reynolds_sphere(dd: float, vd: float, rho_fld: float, mu_fld: float) -> float:
     """Reynolds Number for Flow Past a Sphere
 
@@ -106,6 +115,7 @@ def reynolds_sphere(dd: float, vd: float, rho_fld: float, mu_fld: float) -> floa
     return re
 
 
+@njit(cache=True)
 def drag_coeff(re: float) -> float:
     """Drag Coefficient of a Sphere
 
@@ -118,16 +128,63 @@ def drag_coeff(re: float) -> float:
         cd (float): Drag Coefficient, unitless
     """
     if re == 0:
-        return float("inf")
+        return math.inf
     cd = 24 / re + 3 / math.sqrt(re) + 0.34
     return cd
 
 
-def velocity_terminal(dd: float, rho_drop: float, rho_fld: float, mu_fld: float, g: float) -> float:
+@njit(cache=True)
+def _velocity_terminal_fixed(
+    dd: float, rho_drop: float, rho_fld: float, mu_fld: float, g: float, tol: float = 1e-3, max_iter: int = 50
+) -> float:
+    """Terminal Velocity by Fixed Point Iteration
+
+    Successive substitution of the velocity and drag coefficient, with an Aitken
+    delta squared extrapolation after every second substitution to lift the linear
+    convergence. Kept as the fallback for velocity_terminal.
+
+    Args:
+        dd (float): Droplet Diameter, feet
+        rho_drop (float): Droplet Density, lbm/ft3
+        rho_fld (float): Density of Fluid, lbm/ft3
+        mu_fld (float): Viscosity of Fluid, lbm/(ft*s)
+        g (float): Gravity Acceleration, ft/s2
+        tol (float): Convergence Tolerance on Velocity, ft/s
+        max_iter (int): Iteration Limit, raises RuntimeError when reached
+
+    Returns:
+        vt (float): Terminal Velocity of Droplet, ft/s
+    """
+    cd = 0.34  # starting drag coeff guess
+    vt = velocity_drop(dd, cd, rho_drop, rho_fld, g)
+
+    for _ in range(max_iter):  # two substitutions, then an aitken delta squared jump from the three iterates
+        vt_1 = velocity_drop(dd, drag_coeff(reynolds_sphere(dd, vt, rho_fld, mu_fld)), rho_drop, rho_fld, g)
+        if abs(vt_1 - vt) < tol:  # convergence check
+            return vt_1
+
+        vt_2 = velocity_drop(dd, drag_coeff(reynolds_sphere(dd, vt_1, rho_fld, mu_fld)), rho_drop, rho_fld, g)
+        if abs(vt_2 - vt_1) < tol:
+            return vt_2
+
+        denom = vt_2 - 2 * vt_1 + vt
+        vt_acc = vt_2 - (vt_2 - vt_1) ** 2 / denom if denom != 0 else vt_2
+        vt = vt_acc if vt_acc > 0 else vt_2  # plain substitution if the jump leaves the domain
+
+    raise RuntimeError("Terminal velocity did not converge within max_iter iterations")
+
+
+@njit(cache=True)
+def velocity_terminal(
+    dd: float, rho_drop: float, rho_fld: float, mu_fld: float, g: float, tol: float = 1e-3, max_iter: int = 50
+) -> float:
     """Terminal Velocity of Droplet moving through a Fluid
 
     Calculate the terminal velocity of a droplet moving through a fluid.
-    Will iterate on the velocity and drag coefficient until convergance occurs.
+    Newton-Raphson on the residual vt**2 * cd(vt) - (4g/3) * dd * drho, which is
+    convex and increasing in vt. The cd = 0.34 seed is the largest velocity possible,
+    so the iteration falls monotonically onto the root. Falls back to fixed point
+    iteration if a step leaves the positive velocities.
 
     Args:
         dd (float): Droplet Diameter, feet
@@ -135,31 +192,88 @@ def velocity_terminal(dd: float, rho_drop: float, rho_fld: float, mu_fld: float,
         rho_fld (float): Density of Fluid, lbm/ft3
         mu_fld (float): Viscosity of Fluid, lbm/(ft*s)
         g (float): Gravity Acceleration, ft/s2
+        tol (float): Convergence Tolerance on Velocity, ft/s
+        max_iter (int): Iteration Limit, raises RuntimeError when reached
 
     Returns:
         vt (float): Terminal Velocity of Droplet, ft/s
     """
+    drho = abs((rho_drop - rho_fld) / rho_fld)  # incase droplet is rising
+    k = (4 * g / 3) * dd * drho  # vt**2 * cd at terminal velocity
+    if k == 0:
+        return 0.0
 
     cd = 0.34  # starting drag coeff guess
     vt = velocity_drop(dd, cd, rho_drop, rho_fld, g)
 
-    while True:  # create an undefined while loop
+    for _ in range(max_iter):
         re = reynolds_sphere(dd, vt, rho_fld, mu_fld)
         cd = drag_coeff(re)
-        vt_new = velocity_drop(dd, cd, rho_drop, rho_fld, g)
-
-        if abs(vt_new - vt) < 0.001:  # convergence check
-            break
+        resid = vt * vt * cd - k
+        slope = (24 + 4.5 * math.sqrt(re)) * vt / re + 0.68 * vt  # d(vt**2 * cd)/dvt
+        vt_new = vt - resid / slope
+
+        if not vt_new > 0:  # overshoot, use the safe iteration
+            return _velocity_terminal_fixed(dd, rho_drop, rho_fld, mu_fld, g, tol, max_iter)
+        if abs(vt_new - vt) < tol:  # convergence check
+            return vt_new
         vt = vt_new
 
-    return vt_new  # the final vt iteration value
+    raise RuntimeError("Terminal velocity did not converge within max_iter iterations")
+
 
+@njit(cache=True)
+def _droplet_diameter_fixed(
+    vt: float, rho_drop: float, rho_fld: float, mu_fld: float, g: float, tol: float = 1e-7, max_iter: int = 50
+) -> float:
+    """Droplet Diameter by Fixed Point Iteration
 
-def droplet_diameter(vt: float, rho_drop: float, rho_fld: float, mu_fld: float, g: float) -> float:
+    Successive substitution of the droplet diameter and drag coefficient, with an
+    Aitken delta squared extrapolation after every second substitution. Kept as
+    the fallback for droplet_diameter.
+
+    Args:
+        vt (float): Terminal Velocity, ft/s
+        rho_drop (float): Droplet Density, lbm/ft3
+        rho_fld (float): Density of Fluid, lbm/ft3
+        mu_fld (float): Viscosity of Fluid, lbm/(ft*s)
+        g (float): Gravity Acceleration, ft/s2
+        tol (float): Convergence Tolerance on Diameter, feet
+        max_iter (int): Iteration Limit, raises RuntimeError when reached
+
+    Returns:
+        dd (float): Droplet Diameter, feet
+    """
+    cd = 0.34
+    dd = diameter_drop(vt, cd, rho_drop, rho_fld, g)
+
+    for _ in range(max_iter):  # same aitken delta squared acceleration as the velocity loop
+        dd_1 = diameter_drop(vt, drag_coeff(reynolds_sphere(dd, vt, rho_fld, mu_fld)), rho_drop, rho_fld, g)
+        if abs(dd_1 - dd) < tol:
+            return dd_1
+
+        dd_2 = diameter_drop(vt, drag_coeff(reynolds_sphere(dd_1, vt, rho_fld, mu_fld)), rho_drop, rho_fld, g)
+        if abs(dd_2 - dd_1) < tol:
+            return dd_2
+
+        denom = dd_2 - 2 * dd_1 + dd
+        dd_acc = dd_2 - (dd_2 - dd_1) ** 2 / denom if denom != 0 else dd_2
+        dd = dd_acc if dd_acc > 0 else dd_2
+
+    raise RuntimeError("Droplet diameter did not converge within max_iter iterations")
+
+
+@njit(cache=True)
+def droplet_diameter(
+    vt: float, rho_drop: float, rho_fld: float, mu_fld: float, g: float, tol: float = 1e-7, max_iter: int = 50
+) -> float:
     """Droplet Diameter for specified Terminal Velocity
 
     Calculate the required droplet diameter for specific terminal velocity.
-    Will iterate on droplet diameter and drag coefficient until convergence.
+    Newton-Raphson on the residual dd * (dd - c * cd(dd)), c = vt**2 * 3 / (4g) * drho,
+    which is convex in dd. One substitution from the cd = 0.34 seed lands above the root,
+    so the iteration falls monotonically onto it. Falls back to fixed point iteration
+    if a step leaves the positive diameters.
 
     Args:
         vt (float): Terminal Velocity, ft/s
@@ -167,23 +281,149 @@ def droplet_diameter(vt: float, rho_drop: float, rho_fld: float, mu_fld: float,
         rho_fld (float): Density of Fluid, lbm/ft3
         mu_fld (float): Viscosity of Fluid, lbm/(ft*s)
         g (float): Gravity Acceleration, ft/s2
+        tol (float): Convergence Tolerance on Diameter, feet
+        max_iter (int): Iteration Limit, raises RuntimeError when reached
 
     Returns:
         dd (float): Droplet Diameter, feet
     """
+    drho = abs(rho_fld / (rho_drop - rho_fld))  # incase droplet is rising
+    c = vt * vt * (3 / (4 * g)) * drho  # dd / cd at the solution
+    if c == 0:
+        return 0.0
+
     cd = 0.34
     dd = diameter_drop(vt, cd, rho_drop, rho_fld, g)
+    re = reynolds_sphere(dd, vt, rho_fld, mu_fld)
+    dd = diameter_drop(vt, drag_coeff(re), rho_drop, rho_fld, g)  # above the root
 
-    while True:
+    for _ in range(max_iter):
         re = reynolds_sphere(dd, vt, rho_fld, mu_fld)
         cd = drag_coeff(re)
-        dd_new = diameter_drop(vt, cd, rho_drop, rho_fld, g)
-
-        if abs(dd_new - dd) < 1e-7:  # how small since we are dealing with tiny numbers in feet...?
-            break
+        resid = dd * (dd - c * cd)
+        slope = 2 * dd - c * (1.5 / math.sqrt(re) + 0.34)  # d(dd**2 - c * dd * cd)/ddd
+        dd_new = dd - resid / slope
+
+        if not dd_new > 0:  # overshoot, use the safe iteration
+            return _droplet_diameter_fixed(vt, rho_drop, rho_fld, mu_fld, g, tol, max_iter)
+        if abs(dd_new - dd) < tol:  # how small since we are dealing with tiny numbers in feet...?
+            return dd_new  # final dd iteration value
         dd = dd_new
 
-    return dd_new  # final dd iteration value
+    raise RuntimeError("Droplet diameter did not converge within max_iter iterations")
+
+
+def velocity_terminal_batch(
+    dd: np.ndarray,
+    rho_drop: np.ndarray,
+    rho_fld: np.ndarray,
+    mu_fld: np.ndarray,
+    g: float,
+    tol: float = 1e-3,
+    max_iter: int = 50,
+) -> np.ndarray:
+    """Terminal Velocity of an Array of Droplets
+
+    Vectorized velocity_terminal for sizing across a droplet size distribution.
+    Applies the same Newton update to every droplet at once, droplets drop out
+    of the update as they converge. Properties can be scalars or arrays that
+    broadcast against the droplet diameters.
+
+    Args:
+        dd (np.ndarray): Droplet Diameters, feet
+        rho_drop (np.ndarray): Droplet Density, lbm/ft3
+        rho_fld (np.ndarray): Density of Fluid, lbm/ft3
+        mu_fld (np.ndarray): Viscosity of Fluid, lbm/(ft*s)
+        g (float): Gravity Acceleration, ft/s2
+        tol (float): Convergence Tolerance on Velocity, ft/s
+        max_iter (int): Iteration Limit, raises RuntimeError when reached
+
+    Returns:
+        vt (np.ndarray): Terminal Velocity of Droplets, ft/s
+    """
+    shape = np.broadcast(dd, rho_drop, rho_fld, mu_fld).shape  # scalars give a 0-d result
+    dd, rho_drop, rho_fld, mu_fld = np.broadcast_arrays(*map(np.atleast_1d, (dd, rho_drop, rho_fld, mu_fld)))
+    drho = np.abs((rho_drop - rho_fld) / rho_fld)  # incase droplet is rising
+    k = (4 * g / 3) * dd * drho  # vt**2 * cd at terminal velocity
+    vt = np.sqrt(k / 0.34)  # starting drag coeff guess
+
+    act = k > 0  # droplets still iterating
+    for _ in range(max_iter):
+        if not np.any(act):
+            return vt.reshape(shape)
+        vt_act = vt[act]
+        re = dd[act] * vt_act * rho_fld[act] / mu_fld[act]
+        sre = np.sqrt(re)
+        cd = 24 / re + 3 / sre + 0.34
+        resid = vt_act * vt_act * cd - k[act]
+        slope = (24 + 4.5 * sre) * vt_act / re + 0.68 * vt_act
+        vt_new = vt_act - resid / slope
+        vt_new = np.where(vt_new > 0, vt_new, 0.5 * vt_act)  # damp any overshoot
+
+        vt[act] = vt_new
+        act[act] = np.abs(vt_new - vt_act) >= tol  # convergence check
+
+    if np.any(act):
+        raise RuntimeError("Terminal velocity did not converge within max_iter iterations")
+    return vt.reshape(shape)
+
+
+def droplet_diameter_batch(
+    vt: np.ndarray,
+    rho_drop: np.ndarray,
+    rho_fld: np.ndarray,
+    mu_fld: np.ndarray,
+    g: float,
+    tol: float = 1e-7,
+    max_iter: int = 50,
+) -> np.ndarray:
+    """Droplet Diameter for an Array of Terminal Velocities
+
+    Vectorized droplet_diameter, applies the same Newton update to every entry
+    at once, entries drop out of the update as they converge. Properties can be
+    scalars or arrays that broadcast against the terminal velocities.
+
+    Args:
+        vt (np.ndarray): Terminal Velocities, ft/s
+        rho_drop (np.ndarray): Droplet Density, lbm/ft3
+        rho_fld (np.ndarray): Density of Fluid, lbm/ft3
+        mu_fld (np.ndarray): Viscosity of Fluid, lbm/(ft*s)
+        g (float): Gravity Acceleration, ft/s2
+        tol (float): Convergence Tolerance on Diameter, feet
+        max_iter (int): Iteration Limit, raises RuntimeError when reached
+
+    Returns:
+        dd (np.ndarray): Droplet Diameters, feet
+    """
+    shape = np.broadcast(vt, rho_drop, rho_fld, mu_fld).shape  # scalars give a 0-d result
+    vt, rho_drop, rho_fld, mu_fld = np.broadcast_arrays(*map(np.atleast_1d, (vt, rho_drop, rho_fld, mu_fld)))
+    drho = np.abs(rho_fld / (rho_drop - rho_fld))  # incase droplet is rising
+    c = vt * vt * (3 / (4 * g)) * drho  # dd / cd at the solution
+    dd = np.zeros(c.shape)
+
+    act = c > 0  # entries still iterating
+    dd_act = 0.34 * c[act]
+    re = dd_act * vt[act] * rho_fld[act] / mu_fld[act]
+    dd[act] = c[act] * (24 / re + 3 / np.sqrt(re) + 0.34)  # one substitution lands above the root
+
+    for _ in range(max_iter):
+        if not np.any(act):
+            return dd.reshape(shape)
+        dd_act, c_act = dd[act], c[act]
+        re = dd_act * vt[act] * rho_fld[act] / mu_fld[act]
+        sre = np.sqrt(re)
+        cd = 24 / re + 3 / sre + 0.34
+        resid = dd_act * (dd_act - c_act * cd)
+        slope = 2 * dd_act - c_act * (1.5 / sre + 0.34)
+        dd_new = dd_act - resid / slope
+        dd_new = np.where(dd_new > 0, dd_new, 0.5 * dd_act)  # damp any overshoot
+
+        dd[act] = dd_new
+        act[act] = np.abs(dd_new - dd_act) >= tol  # convergence check
+
+    if np.any(act):
+        raise RuntimeError("Droplet diameter did not converge within max_iter iterations")
+    return dd.reshape(shape)
 
 
 def coal_plate_length(vt: float, vx: float, pgap: float = 0.75, angl: float = 45, pf: float = 0.6) -> float:
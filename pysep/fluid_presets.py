@@ -0,0 +1,20 @@
+"""Shared Fluid Property Presets
+
+Streams that repeat across the vessel scripts. Presets carry zero mass flow,
+set the rate and any differing property with dataclasses.replace, for example
+replace(WAT_STD, mass_flow=1.482e6).
+"""
+
+from pysep.fluids import FluidProps
+
+OIL_STD = FluidProps(
+    mass_flow=0,  # lbm/hr
+    density=58.74,  # lbm/ft3, 100 PSIG and 120 deg F
+    viscosity=52,  # centipoise
+    drop_iw=200,  # micron, smallest oil droplet to be removed from water
+    drop_ig=100,  # micron, oil in gas, 140 and below can be caught by demister pad
+)
+
+WAT_STD = FluidProps.water_std()  # 62.46 lbm/ft3, 0.75 cP, 500 micron in oil, 100 micron in gas
+
+GAS_DEMISTER = FluidProps.gas_std()  # 0.9444 lbm/ft3, 1.327e-2 cP, 140 micron caught by demister
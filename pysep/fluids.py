@@ -1,5 +1,14 @@
+import math
+from dataclasses import dataclass, fields
+
+import numpy as np
+
 from pysep.geometry import vessel_area_three_phase, vessel_area_two_phase
 
+_INV_60 = 1.0 / 60.0  # seconds to minutes
+_INV_3600 = 1.0 / 3600.0  # per hour to per second
+_REQ_KEYS = frozenset({"mass_flow", "density", "viscosity"})  # keys every stream dictionary needs
+
 
 def volm_flow(mflo: float, rho: float) -> float:
     """Calculate Volumetric Flow from Mass Flow / Density
@@ -11,7 +20,7 @@ def volm_flow(mflo: float, rho: float) -> float:
     Returns:
         vflo (float): Volumetric Flow, ft3/s
     """
-    return (mflo / rho) * (1 / (60 * 60))  # ft3/s
+    return mflo / rho * _INV_3600  # ft3/s
 
 
 def velocity_volm(vflo: float, area: float) -> float:
@@ -37,7 +46,7 @@ def retention(leff: float, vx: float) -> float:
     Returns:
         ret (float): Retention Time, minutes
     """
-    ret = (leff / vx) * (1 / 60)
+    ret = (leff / vx) * _INV_60
     return ret
 
 
@@ -102,7 +111,7 @@ def liquid_viscosity(fw: float, mu_oil: float, mu_wat: float) -> float:
     return mu_liq
 
 
-def validate_props(props: dict, req_keys: set) -> None:
+def validate_props(props: dict, req_keys: set | frozenset) -> None:
     """Validate Dictionary of Stream Properties
 
     Ensures that the dictionaries that are fed to the class have the
@@ -110,44 +119,172 @@ def validate_props(props: dict, req_keys: set) -> None:
 
     Args:
         props (dict): Dictionary of Properties
-        req_keys (set): Set of Required Keys
+        req_keys (set | frozenset): Set of Required Keys
     """
     missing_keys = req_keys - set(props.keys())
     if missing_keys:
-        raise KeyError(f"Missing Keys from Property Dictionary: {missing_keys}")
+        raise KeyError(f"Missing Keys from Property Dictionary: {set(missing_keys)}")
+
+
+@dataclass(frozen=True, slots=True)
+class FluidProps:
+    """Fluid Stream Properties
+
+    Immutable replacement for the stream property dictionaries. Instances are
+    hashable, so streams with identical properties can be shared between vessels.
+    Values are checked once when the instance is created.
+
+    Args:
+        mass_flow (float): Mass Flow, lbm/hr
+        density (float): Density, lbm/ft3
+        viscosity (float): Dynamic Viscosity, centipoise
+        drop_io (float): Smallest Droplet to be Removed from Oil, micron
+        drop_iw (float): Smallest Droplet to be Removed from Water, micron
+        drop_ig (float): Smallest Droplet to be Removed from Gas, micron
+    """
+
+    mass_flow: float
+    density: float
+    viscosity: float
+    drop_io: float = math.nan
+    drop_iw: float = math.nan
+    drop_ig: float = math.nan
+
+    def __post_init__(self) -> None:
+        """Validate the properties once, at construction"""
+        if self.mass_flow < 0:
+            raise ValueError("Mass flow must be zero or positive")
+        if self.density <= 0:
+            raise ValueError("Density must be positive")
+        if self.viscosity <= 0:
+            raise ValueError("Viscosity must be positive")
+
+    @classmethod
+    def from_dict(cls, props: dict) -> "FluidProps":
+        """Fluid Properties from a Dictionary
+
+        Validates the dictionary once, any keys that are not a field are ignored.
+
+        Args:
+            props (dict): Dictionary of Properties
+
+        Returns:
+            fluid (FluidProps): Fluid Properties
+        """
+        validate_props(props, _REQ_KEYS)
+        return cls(**{fd.name: props[fd.name] for fd in fields(cls) if fd.name in props})
+
+    @classmethod
+    def water_std(cls) -> "FluidProps":
+        """Standard Produced Water, zero mass flow. Use dataclasses.replace to set the rate."""
+        return _WATER_STD
+
+    @classmethod
+    def gas_std(cls) -> "FluidProps":
+        """Standard Separator Gas with a Demister, zero mass flow. Use dataclasses.replace to set the rate."""
+        return _GAS_STD
+
+
+_WATER_STD = FluidProps(mass_flow=0, density=62.46, viscosity=0.75, drop_io=500, drop_ig=100)
+_GAS_STD = FluidProps(mass_flow=0, density=0.9444, viscosity=1.327e-2, drop_io=140, drop_iw=140)
+
+
+def to_fluid_props(props: dict | FluidProps) -> FluidProps:
+    """Fluid Properties from either a Dictionary or FluidProps
 
+    Args:
+        props (dict | FluidProps): Stream Properties
+
+    Returns:
+        fluid (FluidProps): Fluid Properties
+    """
+    if isinstance(props, FluidProps):
+        return props
+    return FluidProps.from_dict(props)
+
+
+FLUID_DTYPE = np.dtype([("mass_flow", "f8"), ("density", "f8"), ("viscosity", "f8")])  # lbm/hr, lbm/ft3, cP
 
-def liquid_props(oil_props: dict, wat_props: dict) -> dict:
-    """Liquid Properties Dictionary
 
-    Input property dictionary for Oil and Water.
-    Output a similiarly designed dictionary for the equivalent liquid.
+def fluid_props_array(props: list[dict | FluidProps] | np.ndarray) -> np.recarray:
+    """Fluid Properties of Many Streams as a Structure of Arrays
+
+    Each field is one contiguous column, and attribute access matches FluidProps,
+    arr.density is the array of every stream density. Used by the batch methods.
+    An existing structured array is checked by to_batch_props instead of rebuilt.
 
     Args:
-        oil_props (dict): Oil Properties
-        wat_props (dict): Water Properties
+        props (list[dict | FluidProps] | np.ndarray): Stream Properties, one per vessel
 
     Returns:
-        liq_props (dict): Liquid Properties
+        fluids (np.recarray): mass_flow, density and viscosity, shape (N,)
     """
-    req_keys = {"mass_flow", "density", "viscosity"}
-    validate_props(oil_props, req_keys)
-    validate_props(wat_props, req_keys)
+    if isinstance(props, np.ndarray):
+        return to_batch_props(props)
+    rows = [(p.mass_flow, p.density, p.viscosity) for p in map(to_fluid_props, props)]
+    return np.array(rows, dtype=FLUID_DTYPE).view(np.recarray)
+
+
+def to_batch_props(props: dict | FluidProps | np.ndarray) -> FluidProps | np.recarray:
+    """Fluid Properties for the Batch Methods
 
-    mflo_liq = oil_props["mass_flow"] + wat_props["mass_flow"]
+    Structured arrays with the FLUID_DTYPE fields are validated and viewed as a
+    recarray, anything else goes through to_fluid_props. Both give attribute
+    access to mass_flow, density and viscosity.
+
+    Args:
+        props (dict | FluidProps | np.ndarray): Stream Properties, shared or one per vessel
 
-    qoil = volm_flow(oil_props["mass_flow"], oil_props["density"])
-    qwat = volm_flow(wat_props["mass_flow"], wat_props["density"])
-    fw = water_fraction(qoil, qwat)
+    Returns:
+        fluid (FluidProps | np.recarray): Fluid Properties
+    """
+    if not isinstance(props, np.ndarray):
+        return to_fluid_props(props)
+    missing = [name for name in FLUID_DTYPE.names if name not in (props.dtype.names or ())]
+    if missing:
+        raise ValueError(f"Property array is missing the fields {missing}, build it with fluid_props_array")
+    props = props.view(np.recarray)
+    if np.any(props.mass_flow < 0):
+        raise ValueError("Mass flow must be zero or positive")
+    if np.any(props.density <= 0):
+        raise ValueError("Density must be positive")
+    if np.any(props.viscosity <= 0):
+        raise ValueError("Viscosity must be positive")
+    return props
+
+
+def liquid_props(oil_props: dict | FluidProps, wat_props: dict | FluidProps) -> FluidProps:
+    """Liquid Properties
+
+    Input properties for Oil and Water, either as a dictionary or FluidProps.
+    Output the properties of the equivalent liquid.
+
+    Args:
+        oil_props (dict | FluidProps): Oil Properties
+        wat_props (dict | FluidProps): Water Properties
+
+    Returns:
+        liq_props (FluidProps): Liquid Properties
+    """
+    oil_props = to_fluid_props(oil_props)
+    wat_props = to_fluid_props(wat_props)
+
+    mflo_liq = oil_props.mass_flow + wat_props.mass_flow
+
+    # volm_flow, water_fraction and the mixing rules written out in place
+    qoil = oil_props.mass_flow / oil_props.density * _INV_3600
+    qwat = wat_props.mass_flow / wat_props.density * _INV_3600
+    fw = qwat / (qoil + qwat)
+    fo = 1 - fw
 
-    rho_liq = liquid_density(fw, oil_props["density"], wat_props["density"])
-    mu_liq = liquid_viscosity(fw, oil_props["viscosity"], wat_props["viscosity"])
+    rho_liq = oil_props.density * fo + wat_props.density * fw
+    mu_liq = oil_props.viscosity * fo + wat_props.viscosity * fw
 
-    liq_props = {
-        "mass_flow": mflo_liq,  # lbm/hr, 40 MMSCFD
-        "density": rho_liq,  # lbm/ft3
-        "viscosity": mu_liq,  # centipoise
-    }
+    liq_props = FluidProps(
+        mass_flow=mflo_liq,  # lbm/hr
+        density=rho_liq,  # lbm/ft3
+        viscosity=mu_liq,  # centipoise
+    )
     return liq_props
 
 
@@ -189,8 +326,8 @@ def two_phase_retention(leff: float, vx_liq: float, vx_gas: float) -> tuple[floa
         ret_liq (float): Liquid Retention Time, minutes
         ret_gas (float): Gas Retention Time, minutes
     """
-    ret_liq = (leff / vx_liq) * (1 / 60)
-    ret_gas = (leff / vx_gas) * (1 / 60)
+    ret_liq = (leff / vx_liq) * _INV_60
+    ret_gas = (leff / vx_gas) * _INV_60
     return ret_liq, ret_gas
 
 
@@ -222,8 +359,8 @@ def two_phase_reynolds(
         re_liq (float): Liquid Reynolds Number, unitless
         re_gas (float): Gas Reynolds, unitless
     """
-    re_liq = reynolds(vel_liq, rho_liq, dhyd_liq, mu_liq)
-    re_gas = reynolds(vel_gas, rho_gas, dhyd_gas, mu_gas)
+    re_liq = rho_liq * vel_liq * dhyd_liq / mu_liq
+    re_gas = rho_gas * vel_gas * dhyd_gas / mu_gas
     return re_liq, re_gas
 
 
@@ -259,8 +396,8 @@ def three_phase_velocities(
     vx_wat = vflo_wat / awat
     vx_gas = vflo_gas / agas
 
-    ret_oil = (lss / vx_oil) * (1 / 60)
-    ret_wat = (lss / vx_wat) * (1 / 60)
-    ret_gas = (lss / vx_gas) * (1 / 60)
+    ret_oil = (lss / vx_oil) * _INV_60
+    ret_wat = (lss / vx_wat) * _INV_60
+    ret_gas = (lss / vx_gas) * _INV_60
 
     return vx_oil, vx_wat, vx_gas, ret_oil, ret_wat, ret_gas
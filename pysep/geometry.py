@@ -1,6 +1,12 @@
 import math
+from dataclasses import dataclass
 
+import numpy as np
 
+from pysep._jit import njit
+
+
+@njit(cache=True)
 def hydraulic_diameter(a: float, wp: float) -> float:
     """Hydraulic Diameter of Non-Filled Pipe
 
@@ -30,10 +36,10 @@ def circle_segment_area(h: float, r: float) -> float:
     Returns:
         a (float): Area of the Segment, ft2 or m2
     """
+    h, r = float(h), float(r)  # compiled helpers take floats
     if h > r:
         raise ValueError("Height must be less than radius for circle segment")
-    a = r**2 * math.acos(1 - (h / r)) - (r - h) * math.sqrt(r**2 - (r - h) ** 2)
-    return a
+    return _circle_segment_area_unchecked(h, r)
 
 
 def circle_segment_perimeter(h: float, r: float) -> float:
@@ -48,10 +54,10 @@ def circle_segment_perimeter(h: float, r: float) -> float:
     Returns:
         p (float): Perimeter of the Segment, ft or m
     """
+    h, r = float(h), float(r)  # compiled helpers take floats
     if h > r:
         raise ValueError("Height must be less than radius for circle segment")
-    p = r * 2 * math.acos((r - h) / r)
-    return p
+    return _circle_segment_perimeter_unchecked(h, r)
 
 
 def circle_chord_length(h: float, r: float) -> float:
@@ -66,12 +72,107 @@ def circle_chord_length(h: float, r: float) -> float:
     Returns:
         c (float): Chord Length Across Circle, ft or m
     """
+    h, r = float(h), float(r)  # compiled helpers take floats
     if h > r:
         raise ValueError("Height must be less than radius for circle segment")
-    c = 2 * math.sqrt(r**2 - (r - h) ** 2)
+    return _circle_chord_length_unchecked(h, r)
+
+
+@njit(cache=True)
+def _circle_segment_area_unchecked(h: float, r: float) -> float:
+    """Circle segment area without the height check, callers validate first"""
+    a = r * r * math.acos(1 - (h / r)) - (r - h) * math.sqrt(h * (2 * r - h))  # r**2 - (r-h)**2 without cancellation
+    return a
+
+
+@njit(cache=True)
+def _circle_segment_perimeter_unchecked(h: float, r: float) -> float:
+    """Circle segment perimeter without the height check, callers validate first"""
+    p = 2 * r * math.acos((r - h) / r)
+    return p
+
+
+@njit(cache=True)
+def _circle_chord_length_unchecked(h: float, r: float) -> float:
+    """Circle chord length without the height check, callers validate first"""
+    c = 2 * math.sqrt(h * (2 * r - h))  # r**2 - (r-h)**2 without cancellation
     return c
 
 
+@njit(cache=True)
+def _segment(h: float, r: float) -> tuple[float, float, float]:
+    """Area, Arc Perimeter and Chord Length of a Circular Segment
+
+    Shares the acos and sqrt between the three, only valid for segments that are
+    less than 50% full. No validation, callers check the height first.
+
+    Args:
+        h (float): Height of the Segment, feet or meters
+        r (float): Radius of the Vessel, feet or meters
+
+    Returns:
+        a (float): Area of the Segment, ft2 or m2
+        p (float): Perimeter of the Segment, ft or m
+        c (float): Chord Length Across Circle, ft or m
+    """
+    rh = r - h
+    t = math.acos(rh / r)
+    s = math.sqrt(h * (2 * r - h))  # half chord, stable as h goes to zero
+    return r * r * t - rh * s, 2 * r * t, 2 * s
+
+
+@dataclass(frozen=True, slots=True)
+class VesselGeometry:
+    """Cross Section of a Horizontal Vessel
+
+    Holds the radius, total area and total perimeter of the vessel so they are
+    calculated once per vessel instead of inside every area and perimeter call.
+    Build with VesselGeometry.from_vid.
+
+    Args:
+        vid (float): Vessel Inner Diameter, feet
+        r (float): Vessel Inner Radius, feet
+        atot (float): Total Cross Sectional Area, ft2
+        pm_tot (float): Total Perimeter, ft
+    """
+
+    vid: float
+    r: float
+    atot: float
+    pm_tot: float
+
+    @classmethod
+    def from_vid(cls, vid: float) -> "VesselGeometry":
+        """Vessel Geometry from the Vessel Inner Diameter, feet"""
+        vid = float(vid)  # compiled helpers take floats
+        r = vid / 2  # radius
+        return cls(vid, r, math.pi * r * r, 2 * math.pi * r)
+
+    def areas_three_phase(self, hoil: float, hwat: float) -> tuple[float, float, float]:
+        """Area of oil, water and gas, see vessel_area_three_phase"""
+        return _area_three_phase(self.vid, self.r, self.atot, float(hoil), float(hwat))
+
+    def perims_three_phase(self, hoil: float, hwat: float) -> tuple[float, float, float]:
+        """Wetted Perimeter of oil, water and gas, see vessel_perim_three_phase"""
+        return _perim_three_phase(self.vid, self.r, self.pm_tot, float(hoil), float(hwat))
+
+    def dhyds_three_phase(self, hoil: float, hwat: float) -> tuple[float, float, float]:
+        """Hydraulic Diameter of oil, water and gas, see vessel_dhyd_three_phase"""
+        return _dhyd_three_phase(self.vid, self.r, self.atot, self.pm_tot, float(hoil), float(hwat))
+
+    def areas_two_phase(self, hliq: float) -> tuple[float, float]:
+        """Area of liquid and gas, see vessel_area_two_phase"""
+        return _area_two_phase(self.vid, self.r, self.atot, float(hliq))
+
+    def perims_two_phase(self, hliq: float) -> tuple[float, float]:
+        """Wetted Perimeter of liquid and gas, see vessel_perim_two_phase"""
+        return _perim_two_phase(self.vid, self.r, self.pm_tot, float(hliq))
+
+    def dhyds_two_phase(self, hliq: float) -> tuple[float, float]:
+        """Hydraulic Diameter of liquid and gas, see vessel_dhyd_two_phase"""
+        return _dhyd_two_phase(self.vid, self.r, self.atot, self.pm_tot, float(hliq))
+
+
 def vessel_area_three_phase(vid: float, hoil: float, hwat: float) -> tuple[float, float, float]:
     """Area of oil, water and gas in a horizontal vessel
 
@@ -84,27 +185,26 @@ def vessel_area_three_phase(vid: float, hoil: float, hwat: float) -> tuple[float
         aoil (float): Area of the Oil, ft2
         awat (float): Area of the Water, ft2
         agas (float): Area of the Gas, ft2"""
+    vid, hoil, hwat = float(vid), float(hoil), float(hwat)  # compiled helpers take floats
+    r = vid / 2  # radius
+    return _area_three_phase(vid, r, math.pi * r * r, hoil, hwat)
 
+
+@njit(cache=True)
+def _area_three_phase(vid: float, r: float, atot: float, hoil: float, hwat: float) -> tuple[float, float, float]:
     if hwat > hoil:
         raise ValueError("Oil height must be less than water height")
     if hoil > vid:
         raise ValueError("Oil height must be less than vessel diameter")
 
-    r = vid / 2  # radius
-    atot = math.pi * r**2
-
-    if hwat <= r:  # if less than or equal to 50% full
-        awat = circle_segment_area(hwat, r)
-    else:  # if above 50% full
-        hwat = vid - hwat  # calculate the other side
-        awat = atot - circle_segment_area(hwat, r)
-
     hgas = vid - hoil  # height of the gas, measured from the top down
-    if hgas <= r:  # if less than or equal to 50% full
-        agas = circle_segment_area(hgas, r)
-    else:  # if above 50% full from the top down
-        hgas = vid - hgas  # calculate the other side
-        agas = atot - circle_segment_area(hgas, r)
+    wat_low = hwat <= r  # less than or equal to 50% full
+    gas_low = hgas <= r  # less than or equal to 50% full from the top down
+
+    a_wat = _circle_segment_area_unchecked(hwat if wat_low else vid - hwat, r)  # segment on the smaller side
+    a_gas = _circle_segment_area_unchecked(hgas if gas_low else hoil, r)
+    awat = a_wat if wat_low else atot - a_wat
+    agas = a_gas if gas_low else atot - a_gas
 
     aoil = atot - awat - agas
     return aoil, awat, agas
@@ -123,30 +223,30 @@ def vessel_perim_three_phase(vid: float, hoil: float, hwat: float) -> tuple[floa
         wp_wat (float): Wetted Perimeter of the Water, ft
         wp_gas (float): Wetted Perimeter of the Gas, ft
     """
+    vid, hoil, hwat = float(vid), float(hoil), float(hwat)  # compiled helpers take floats
+    r = vid / 2  # radius
+    return _perim_three_phase(vid, r, math.pi * 2 * r, hoil, hwat)
+
+
+@njit(cache=True)
+def _perim_three_phase(vid: float, r: float, pm_tot: float, hoil: float, hwat: float) -> tuple[float, float, float]:
     if hwat > hoil:
         raise ValueError("Oil height must be less than water height")
     if hoil > vid:
         raise ValueError("Oil height must be less than vessel diameter")
 
-    r = vid / 2  # radius
-    pm_tot = math.pi * 2 * r  # perimeter of a normal circle
-
-    if hwat <= r:  # if less than or equal to 50% full
-        pm_wat = circle_segment_perimeter(hwat, r)
-        ch_wat = circle_chord_length(hwat, r)
-    else:  # if above 50% full
-        hwat = vid - hwat  # calculate the other side
-        pm_wat = pm_tot - circle_segment_perimeter(hwat, r)
-        ch_wat = circle_chord_length(hwat, r)
-
     hgas = vid - hoil  # height of the gas, measured from the top down
-    if hgas <= r:  # if less than or equal to 50% full
-        pm_gas = circle_segment_perimeter(hgas, r)
-        ch_gas = circle_chord_length(hgas, r)
-    else:  # if above 50% full from the top down
-        hgas = vid - hgas  # calculate the other side
-        pm_gas = pm_tot - circle_segment_perimeter(hgas, r)
-        ch_gas = circle_chord_length(hgas, r)
+    wat_low = hwat <= r  # less than or equal to 50% full
+    gas_low = hgas <= r  # less than or equal to 50% full from the top down
+
+    h_wat = hwat if wat_low else vid - hwat  # segment on the smaller side
+    h_gas = hgas if gas_low else hoil
+    pm_wat = _circle_segment_perimeter_unchecked(h_wat, r)
+    pm_gas = _circle_segment_perimeter_unchecked(h_gas, r)
+    ch_wat = _circle_chord_length_unchecked(h_wat, r)
+    ch_gas = _circle_chord_length_unchecked(h_gas, r)
+    pm_wat = pm_wat if wat_low else pm_tot - pm_wat
+    pm_gas = pm_gas if gas_low else pm_tot - pm_gas
 
     pm_oil = pm_tot - pm_wat - pm_gas
 
@@ -169,11 +269,35 @@ def vessel_dhyd_three_phase(vid: float, hoil: float, hwat: float) -> tuple[float
         dhyd_wat (float): Hydraulic Diameter of the Water, ft2
         dhyd_gas (float): Hydraulic Diameter of the Gas, ft2
     """
-    aoil, awat, agas = vessel_area_three_phase(vid, hoil, hwat)
-    wpoil, wpwat, wpgas = vessel_perim_three_phase(vid, hoil, hwat)
-    dhyd_oil = hydraulic_diameter(aoil, wpoil)
-    dhyd_wat = hydraulic_diameter(awat, wpwat)
-    dhyd_gas = hydraulic_diameter(agas, wpgas)
+    vid, hoil, hwat = float(vid), float(hoil), float(hwat)  # compiled helpers take floats
+    r = vid / 2  # radius
+    return _dhyd_three_phase(vid, r, math.pi * r * r, math.pi * 2 * r, hoil, hwat)
+
+
+@njit(cache=True)
+def _dhyd_three_phase(
+    vid: float, r: float, atot: float, pm_tot: float, hoil: float, hwat: float
+) -> tuple[float, float, float]:
+    if hwat > hoil:
+        raise ValueError("Oil height must be less than water height")
+    if hoil > vid:
+        raise ValueError("Oil height must be less than vessel diameter")
+
+    hgas = vid - hoil  # height of the gas, measured from the top down
+    wat_low = hwat <= r  # less than or equal to 50% full
+    gas_low = hgas <= r  # less than or equal to 50% full from the top down
+
+    a_wat, pm_wat, ch_wat = _segment(hwat if wat_low else vid - hwat, r)  # segment on the smaller side
+    a_gas, pm_gas, ch_gas = _segment(hgas if gas_low else hoil, r)
+    awat, pm_wat = (a_wat, pm_wat) if wat_low else (atot - a_wat, pm_tot - pm_wat)
+    agas, pm_gas = (a_gas, pm_gas) if gas_low else (atot - a_gas, pm_tot - pm_gas)
+
+    aoil = atot - awat - agas
+    pm_oil = pm_tot - pm_wat - pm_gas
+
+    dhyd_oil = hydraulic_diameter(aoil, pm_oil + ch_wat + ch_gas)
+    dhyd_wat = hydraulic_diameter(awat, pm_wat + ch_wat)
+    dhyd_gas = hydraulic_diameter(agas, pm_gas + ch_gas)
     return dhyd_oil, dhyd_wat, dhyd_gas
 
 
@@ -187,18 +311,19 @@ def vessel_area_two_phase(vid: float, hliq: float) -> tuple[float, float]:
     Returns:
         aliq (float): Area of the Liquid, ft2
         agas (float): Area of the Gas, ft2"""
+    vid, hliq = float(vid), float(hliq)  # compiled helpers take floats
+    r = vid / 2  # radius
+    return _area_two_phase(vid, r, math.pi * r * r, hliq)
 
+
+@njit(cache=True)
+def _area_two_phase(vid: float, r: float, atot: float, hliq: float) -> tuple[float, float]:
     if hliq > vid:
         raise ValueError("Liquid height must be less than vessel diameter")
 
-    r = vid / 2  # radius
-    atot = math.pi * r**2
-
-    if hliq <= r:  # if less than or equal to 50% full
-        aliq = circle_segment_area(hliq, r)
-    else:  # if above 50% full
-        hliq = vid - hliq  # calculate the other side
-        aliq = atot - circle_segment_area(hliq, r)
+    liq_low = hliq <= r  # less than or equal to 50% full
+    a_seg = _circle_segment_area_unchecked(hliq if liq_low else vid - hliq, r)  # segment on the smaller side
+    aliq = a_seg if liq_low else atot - a_seg
 
     agas = atot - aliq
     return aliq, agas
@@ -215,19 +340,21 @@ def vessel_perim_two_phase(vid: float, hliq: float) -> tuple[float, float]:
         wpliq (float): Wetted Perimeter of the Liquid, ft2
         wpgas (float): Wetted Perimeter of the Gas, ft2
     """
+    vid, hliq = float(vid), float(hliq)  # compiled helpers take floats
+    r = vid / 2  # radius
+    return _perim_two_phase(vid, r, math.pi * 2 * r, hliq)
+
+
+@njit(cache=True)
+def _perim_two_phase(vid: float, r: float, pm_tot: float, hliq: float) -> tuple[float, float]:
     if hliq > vid:
         raise ValueError("Liquid height must be less than vessel diameter")
 
-    r = vid / 2  # radius
-    pm_tot = math.pi * 2 * r  # perimeter of a normal circle
-
-    if hliq <= r:  # if less than or equal to 50% full
-        pm_liq = circle_segment_perimeter(hliq, r)
-        ch_liq = circle_chord_length(hliq, r)
-    else:  # if above 50% full
-        hliq = vid - hliq  # calculate the other side
-        pm_liq = pm_tot - circle_segment_perimeter(hliq, r)
-        ch_liq = circle_chord_length(hliq, r)
+    liq_low = hliq <= r  # less than or equal to 50% full
+    h_seg = hliq if liq_low else vid - hliq  # segment on the smaller side
+    pm_seg = _circle_segment_perimeter_unchecked(h_seg, r)
+    ch_liq = _circle_chord_length_unchecked(h_seg, r)
+    pm_liq = pm_seg if liq_low else pm_tot - pm_seg
 
     pm_gas = pm_tot - pm_liq
     wp_liq = pm_liq + ch_liq
@@ -246,8 +373,235 @@ def vessel_dhyd_two_phase(vid: float, hliq: float) -> tuple[float, float]:
         dhyd_liq (float): Hydraulic Diameter of the Liquid, ft
         dhyd_gas (float): Hydraulic Diameter of the Gas, ft
     """
-    aliq, agas = vessel_area_two_phase(vid, hliq)
-    wpliq, wpgas = vessel_perim_two_phase(vid, hliq)
-    dhyd_liq = hydraulic_diameter(aliq, wpliq)
-    dhyd_gas = hydraulic_diameter(agas, wpgas)
+    vid, hliq = float(vid), float(hliq)  # compiled helpers take floats
+    r = vid / 2  # radius
+    return _dhyd_two_phase(vid, r, math.pi * r * r, math.pi * 2 * r, hliq)
+
+
+@njit(cache=True)
+def _dhyd_two_phase(vid: float, r: float, atot: float, pm_tot: float, hliq: float) -> tuple[float, float]:
+    if hliq > vid:
+        raise ValueError("Liquid height must be less than vessel diameter")
+
+    liq_low = hliq <= r  # less than or equal to 50% full
+    a_seg, pm_seg, ch_liq = _segment(hliq if liq_low else vid - hliq, r)  # segment on the smaller side
+    aliq, pm_liq = (a_seg, pm_seg) if liq_low else (atot - a_seg, pm_tot - pm_seg)
+
+    dhyd_liq = hydraulic_diameter(aliq, pm_liq + ch_liq)
+    dhyd_gas = hydraulic_diameter(atot - aliq, pm_tot - pm_liq + ch_liq)
+    return dhyd_liq, dhyd_gas
+
+
+def _segment_np(h: np.ndarray, r: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Area, Arc Perimeter and Chord Length of Circular Segments, see _segment"""
+    rh = r - h
+    t = np.arccos(rh / r)
+    s = np.sqrt(h * (2 * r - h))  # half chord, stable as h goes to zero
+    return r * r * t - rh * s, 2 * r * t, 2 * s
+
+
+def _check_three_phase_np(vid: np.ndarray, hoil: np.ndarray, hwat: np.ndarray) -> None:
+    if np.any(hwat > hoil):
+        raise ValueError("Oil height must be less than water height")
+    if np.any(hoil > vid):
+        raise ValueError("Oil height must be less than vessel diameter")
+
+
+def vessel_area_three_phase_np(
+    vid: np.ndarray, hoil: np.ndarray, hwat: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Area of oil, water and gas in a horizontal vessel for arrays
+
+    Vectorized vessel_area_three_phase for sweeps across heights or diameters.
+    Inputs broadcast against each other.
+
+    Args:
+        vid (np.ndarray): Vessel Inner Diameter, feet
+        hoil (np.ndarray): Height of the Oil in the Vessel, feet
+        hwat (np.ndarray): Height of the Water in the Vessel, feet
+
+    Returns:
+        aoil (np.ndarray): Area of the Oil, ft2
+        awat (np.ndarray): Area of the Water, ft2
+        agas (np.ndarray): Area of the Gas, ft2
+    """
+    vid, hoil, hwat = np.asarray(vid, dtype=float), np.asarray(hoil, dtype=float), np.asarray(hwat, dtype=float)
+    _check_three_phase_np(vid, hoil, hwat)
+
+    r = vid / 2  # radius
+    atot = np.pi * r * r
+    hgas = vid - hoil  # height of the gas, measured from the top down
+    wat_low = hwat <= r  # less than or equal to 50% full
+    gas_low = hgas <= r  # less than or equal to 50% full from the top down
+
+    a_wat = _segment_np(np.where(wat_low, hwat, vid - hwat), r)[0]
+    a_gas = _segment_np(np.where(gas_low, hgas, hoil), r)[0]
+    awat = np.where(wat_low, a_wat, atot - a_wat)
+    agas = np.where(gas_low, a_gas, atot - a_gas)
+    return atot - awat - agas, awat, agas
+
+
+def vessel_perim_three_phase_np(
+    vid: np.ndarray, hoil: np.ndarray, hwat: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Wetted Perimeter of oil, water and gas in a horizontal vessel for arrays
+
+    Vectorized vessel_perim_three_phase for sweeps across heights or diameters.
+    Inputs broadcast against each other.
+
+    Args:
+        vid (np.ndarray): Vessel Inner Diameter, feet
+        hoil (np.ndarray): Height of the Oil in the Vessel, feet
+        hwat (np.ndarray): Height of the Water in the Vessel, feet
+
+    Returns:
+        wp_oil (np.ndarray): Wetted Perimeter of the Oil, ft
+        wp_wat (np.ndarray): Wetted Perimeter of the Water, ft
+        wp_gas (np.ndarray): Wetted Perimeter of the Gas, ft
+    """
+    vid, hoil, hwat = np.asarray(vid, dtype=float), np.asarray(hoil, dtype=float), np.asarray(hwat, dtype=float)
+    _check_three_phase_np(vid, hoil, hwat)
+
+    r = vid / 2  # radius
+    pm_tot = np.pi * 2 * r  # perimeter of a normal circle
+    hgas = vid - hoil  # height of the gas, measured from the top down
+    wat_low = hwat <= r  # less than or equal to 50% full
+    gas_low = hgas <= r  # less than or equal to 50% full from the top down
+
+    _, pm_wat, ch_wat = _segment_np(np.where(wat_low, hwat, vid - hwat), r)
+    _, pm_gas, ch_gas = _segment_np(np.where(gas_low, hgas, hoil), r)
+    pm_wat = np.where(wat_low, pm_wat, pm_tot - pm_wat)
+    pm_gas = np.where(gas_low, pm_gas, pm_tot - pm_gas)
+
+    pm_oil = pm_tot - pm_wat - pm_gas
+    return pm_oil + ch_wat + ch_gas, pm_wat + ch_wat, pm_gas + ch_gas
+
+
+def vessel_dhyd_three_phase_np(
+    vid: np.ndarray, hoil: np.ndarray, hwat: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Hydraulic Diameter of oil, water and gas in a horizontal vessel for arrays
+
+    Vectorized vessel_dhyd_three_phase for sweeps across heights or diameters.
+    Inputs broadcast against each other.
+
+    Args:
+        vid (np.ndarray): Vessel Inner Diameter, feet
+        hoil (np.ndarray): Height of the Oil in the Vessel, feet
+        hwat (np.ndarray): Height of the Water in the Vessel, feet
+
+    Returns:
+        dhyd_oil (np.ndarray): Hydraulic Diameter of the Oil, ft
+        dhyd_wat (np.ndarray): Hydraulic Diameter of the Water, ft
+        dhyd_gas (np.ndarray): Hydraulic Diameter of the Gas, ft
+    """
+    vid, hoil, hwat = np.asarray(vid, dtype=float), np.asarray(hoil, dtype=float), np.asarray(hwat, dtype=float)
+    _check_three_phase_np(vid, hoil, hwat)
+
+    r = vid / 2  # radius
+    atot = np.pi * r * r
+    pm_tot = np.pi * 2 * r  # perimeter of a normal circle
+    hgas = vid - hoil  # height of the gas, measured from the top down
+    wat_low = hwat <= r  # less than or equal to 50% full
+    gas_low = hgas <= r  # less than or equal to 50% full from the top down
+
+    a_wat, pm_wat, ch_wat = _segment_np(np.where(wat_low, hwat, vid - hwat), r)
+    a_gas, pm_gas, ch_gas = _segment_np(np.where(gas_low, hgas, hoil), r)
+    awat = np.where(wat_low, a_wat, atot - a_wat)
+    agas = np.where(gas_low, a_gas, atot - a_gas)
+    pm_wat = np.where(wat_low, pm_wat, pm_tot - pm_wat)
+    pm_gas = np.where(gas_low, pm_gas, pm_tot - pm_gas)
+
+    aoil = atot - awat - agas
+    pm_oil = pm_tot - pm_wat - pm_gas
+
+    dhyd_oil = 4 * aoil / (pm_oil + ch_wat + ch_gas)  # hydraulic_diameter in plain numpy
+    dhyd_wat = 4 * awat / (pm_wat + ch_wat)
+    dhyd_gas = 4 * agas / (pm_gas + ch_gas)
+    return dhyd_oil, dhyd_wat, dhyd_gas
+
+
+def vessel_area_two_phase_np(vid: np.ndarray, hliq: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Area of liquid and gas in a horizontal vessel for arrays
+
+    Vectorized vessel_area_two_phase for sweeps across heights or diameters.
+    Inputs broadcast against each other.
+
+    Args:
+        vid (np.ndarray): Vessel Inner Diameter, feet
+        hliq (np.ndarray): Height of the Liquid in the Vessel, feet
+
+    Returns:
+        aliq (np.ndarray): Area of the Liquid, ft2
+        agas (np.ndarray): Area of the Gas, ft2
+    """
+    vid, hliq = np.asarray(vid, dtype=float), np.asarray(hliq, dtype=float)
+    if np.any(hliq > vid):
+        raise ValueError("Liquid height must be less than vessel diameter")
+
+    r = vid / 2  # radius
+    atot = np.pi * r * r
+    liq_low = hliq <= r  # less than or equal to 50% full
+
+    a_seg = _segment_np(np.where(liq_low, hliq, vid - hliq), r)[0]
+    aliq = np.where(liq_low, a_seg, atot - a_seg)
+    return aliq, atot - aliq
+
+
+def vessel_perim_two_phase_np(vid: np.ndarray, hliq: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Wetted Perimeter of liquid and gas in a horizontal vessel for arrays
+
+    Vectorized vessel_perim_two_phase for sweeps across heights or diameters.
+    Inputs broadcast against each other.
+
+    Args:
+        vid (np.ndarray): Vessel Inner Diameter, feet
+        hliq (np.ndarray): Height of the Liquid in the Vessel, feet
+
+    Returns:
+        wpliq (np.ndarray): Wetted Perimeter of the Liquid, ft
+        wpgas (np.ndarray): Wetted Perimeter of the Gas, ft
+    """
+    vid, hliq = np.asarray(vid, dtype=float), np.asarray(hliq, dtype=float)
+    if np.any(hliq > vid):
+        raise ValueError("Liquid height must be less than vessel diameter")
+
+    r = vid / 2  # radius
+    pm_tot = np.pi * 2 * r  # perimeter of a normal circle
+    liq_low = hliq <= r  # less than or equal to 50% full
+
+    _, pm_seg, ch_liq = _segment_np(np.where(liq_low, hliq, vid - hliq), r)
+    pm_liq = np.where(liq_low, pm_seg, pm_tot - pm_seg)
+    return pm_liq + ch_liq, pm_tot - pm_liq + ch_liq
+
+
+def vessel_dhyd_two_phase_np(vid: np.ndarray, hliq: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Hydraulic Diameter of liquid and gas in a horizontal vessel for arrays
+
+    Vectorized vessel_dhyd_two_phase for sweeps across heights or diameters.
+    Inputs broadcast against each other.
+
+    Args:
+        vid (np.ndarray): Vessel Inner Diameter, feet
+        hliq (np.ndarray): Height of the Liquid in the Vessel, feet
+
+    Returns:
+        dhyd_liq (np.ndarray): Hydraulic Diameter of the Liquid, ft
+        dhyd_gas (np.ndarray): Hydraulic Diameter of the Gas, ft
+    """
+    vid, hliq = np.asarray(vid, dtype=float), np.asarray(hliq, dtype=float)
+    if np.any(hliq > vid):
+        raise ValueError("Liquid height must be less than vessel diameter")
+
+    r = vid / 2  # radius
+    atot = np.pi * r * r
+    pm_tot = np.pi * 2 * r  # perimeter of a normal circle
+    liq_low = hliq <= r  # less than or equal to 50% full
+
+    a_seg, pm_seg, ch_liq = _segment_np(np.where(liq_low, hliq, vid - hliq), r)
+    aliq = np.where(liq_low, a_seg, atot - a_seg)
+    pm_liq = np.where(liq_low, pm_seg, pm_tot - pm_seg)
+
+    dhyd_liq = 4 * aliq / (pm_liq + ch_liq)  # hydraulic_diameter in plain numpy
+    dhyd_gas = 4 * (atot - aliq) / (pm_tot - pm_liq + ch_liq)
     return dhyd_liq, dhyd_gas
@@ -1,7 +1,13 @@
 """Storing all the mechanical and pressure rating equations for a separator"""
 
+from functools import lru_cache
 from math import log, pi, sqrt
 
+# 2:1 elliptical head, the eccentricity and log term of the oblate spheroid do not depend on diameter
+_ECC_21 = sqrt(0.75)  # sqrt(1 - (1/2)**2)
+_LOG_21 = log((1 + _ECC_21) / (1 - _ECC_21))
+_HEAD_COEFF = pi * (2 + 0.25 / _ECC_21 * _LOG_21) / 2  # half spheroid area over x_radius**2
+
 
 def sep_shell_thick(vid: float, mawp: float, sv: float = 20000, eff: float = 1, corr: float = 0.125) -> float:
     """Separator Shell Thickness
@@ -39,11 +45,17 @@ def surface_spheroid_oblate(x_radius: float, y_radius: float) -> float:
     """
     if x_radius <= y_radius:
         raise ValueError("X-Radius needs to be bigger than Y-Radius for an Oblate Spheroid")
-    ecc = sqrt(1 - (y_radius**2 / x_radius**2))
-    a_surf = 2 * pi * x_radius**2 + (pi * y_radius**2 / ecc) * log((1 + ecc) / (1 - ecc))
+    a_surf = _oblate_coeff(y_radius / x_radius) * x_radius * x_radius
     return a_surf
 
 
+@lru_cache(maxsize=64)
+def _oblate_coeff(ratio: float) -> float:
+    """Oblate spheroid surface area over x_radius**2, only depends on the y / x aspect ratio"""
+    ecc = sqrt(1 - ratio * ratio)
+    return pi * (2 + (ratio * ratio / ecc) * log((1 + ecc) / (1 - ecc)))
+
+
 def surface_cylinder(diam: float, height: float) -> float:
     """Surface Area of a Cylinder
 
@@ -70,9 +82,7 @@ def surface_elliptical_head(vid: float) -> float:
         a_head (float): Surface Area of One Elliptical Head, ft2
     """
     x_radius = vid / 2  # diameter to radius
-    y_radius = x_radius / 2  # for the 2:1 aspect flair
-    a_surf = surface_spheroid_oblate(x_radius, y_radius)  # this gives the entire spheroid, we need half of it
-    return a_surf / 2
+    return _HEAD_COEFF * x_radius * x_radius  # half of surface_spheroid_oblate(x_radius, x_radius / 2)
 
 
 def vessel_bare_weight(vid: float, lss: float, thk: float, rho_metal: float = 490) -> float:
@@ -100,15 +110,14 @@ def vessel_bare_weight(vid: float, lss: float, thk: float, rho_metal: float = 49
 
 
 if __name__ == "__main__":
-
     fpad_vid = 126 / 12
     fpad_lss = 40
     fpad_thk = 2.39  # inches
 
     fpad_mawp = 700  # psig
     calc_thk = sep_shell_thick(fpad_vid, fpad_mawp)
-    print(f"F-Pad Calc Thickness {round(calc_thk, 2)} inches vs. Actual Thickness {fpad_thk} inches")
+    print(f"F-Pad Calc Thickness {calc_thk:.2f} inches vs. Actual Thickness {fpad_thk} inches")
 
     fpad_bare = vessel_bare_weight(fpad_vid, fpad_lss, fpad_thk)
 
-    print(f"F-Pad Bare Vessel Weight: {round(fpad_bare, 0)} lbm")
+    print(f"F-Pad Bare Vessel Weight: {fpad_bare:.0f} lbm")
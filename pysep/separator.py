@@ -1,19 +1,51 @@
+from functools import lru_cache
+
 import numpy as np
 
 import pysep.drops as drp
 import pysep.fluids as fld
 import pysep.mechanical as mech
-from pysep.geometry import (
-    vessel_area_three_phase,
-    vessel_area_two_phase,
-    vessel_dhyd_three_phase,
-    vessel_dhyd_two_phase,
+from pysep._jit import HAS_NUMBA
+from pysep._kernels import _terminal_velocity_array, _three_phase_core, _three_phase_sweep, _two_phase_core
+from pysep.geometry import VesselGeometry, _check_three_phase_np, vessel_area_two_phase_np, vessel_dhyd_two_phase_np
+
+_GRAVITY = 32.174  # ft/s2, shared by the constructors and the array methods
+
+# record layout of SepThreePhase.sweep, same order as the _three_phase_core tuple
+_THREE_PHASE_DTYPE = np.dtype(
+    [
+        (name, "f8")
+        for name in (
+            "aoil",
+            "awat",
+            "agas",
+            "vx_oil",
+            "vx_wat",
+            "vx_gas",
+            "ret_oil",
+            "ret_wat",
+            "ret_gas",
+            "re_oil",
+            "re_wat",
+            "re_gas",
+            "drop_oiw",
+            "drop_wio",
+            "drop_oig",
+        )
+    ]
 )
 
 
+def _cell(val: float | str, spec: str) -> str:
+    """Right aligned results table cell, strings such as the "-" for an empty cell skip the number format"""
+    return f"{val:>8}" if isinstance(val, str) else f"{val:>8{spec}}"
+
+
 class SepMech:
     """Parent Class for inheritting mechanical methods that are the same in either a two or three phase sep."""
 
+    __slots__ = ("geom", "lss", "vid")  # no per instance __dict__ for large sweeps
+
     def __init__(self, vid: float, lss: float) -> None:
         """Parent Class of Separator
 
@@ -25,97 +57,193 @@ class SepMech:
         """
         self.vid = vid
         self.lss = lss
+        self.geom = VesselGeometry.from_vid(vid)  # radius, area and perimeter shared by every phase
 
     def __repr__(self) -> str:
         return f"\nType: {self.__class__.__name__}, Vessel ID: {self.vid: .2f} ft., Seam-Seam Length: {self.lss: .2f} ft.\n"  # noqa: E501
 
-    def shell_thick(self, mawp: float, sv: float = 20000, eff: float = 1, corr: float = 0.125) -> float:
+    def shell_thick(
+        self, mawp: float | np.ndarray, sv: float = 20000, eff: float = 1, corr: float = 0.125
+    ) -> float | np.ndarray:
         """Separator Shell Thickness
 
         Calculate the separator shell thickness. UG-27c Eqn. 1
+        An array of pressures returns an array of thicknesses for sensitivity studies.
 
         Args:
-            mawp (float): Max Allowable Working Pressure, psig
+            mawp (float | np.ndarray): Max Allowable Working Pressure, psig
             sv (float): Material Max Allowable Stress, psig
             eff (float): Joint Efficiency Factor
             corr (float): Corrosion Allowance, inches
 
         Returns:
-            thk (float): Shell Thickness, inches
+            thk (float | np.ndarray): Shell Thickness, inches
         """
-        self.mawp = mawp
+        if np.ndim(mawp):
+            mawp = np.asarray(mawp, dtype=float)
         return mech.sep_shell_thick(self.vid, mawp, sv, eff, corr)
 
-    def weight_bare(self, thk: float, rho_metal: float = 490) -> float:
+    def weight_bare(self, thk: float | np.ndarray, rho_metal: float = 490) -> float | np.ndarray:
         """Separator Bare Weight
 
         Weight of the Vessel with just the body and elliptical heads. Doesn't
         include the weights of any internals, insulation, nozzles, or supports.
 
         Args:
-            thk (float): Vessel Thickness, inches
+            thk (float | np.ndarray): Vessel Thickness, inches
             rho_metal (float): Density of Metal, lbm/ft3
 
         Return:
-            wbv (float): Weight of Bare Vessel, lbm
+            wbv (float | np.ndarray): Weight of Bare Vessel, lbm
         """
+        if np.ndim(thk):
+            thk = np.asarray(thk, dtype=float)  # lists of thicknesses from a pressure sweep
         return mech.vessel_bare_weight(self.vid, self.lss, thk, rho_metal)
 
 
 class SepTwoPhase(SepMech):
-    def __init__(self, vid: float, lss: float, leff: float, hliq: float, liq_props: dict, gas_props: dict) -> None:
+    __slots__ = (
+        "_mu_gas_lbm",
+        "_mu_liq_lbm",
+        "agas",
+        "aliq",
+        "drop_liq",
+        "g",
+        "gas_props",
+        "hliq",
+        "leff",
+        "liq_props",
+        "re_gas",
+        "re_liq",
+        "ret_gas",
+        "ret_liq",
+        "vx_gas",
+        "vx_liq",
+    )
+
+    def __init__(
+        self,
+        vid: float,
+        lss: float,
+        leff: float,
+        hliq: float,
+        liq_props: dict | fld.FluidProps,
+        gas_props: dict | fld.FluidProps,
+    ) -> None:
         """Two Phase Separator of Gas and Liquid
 
+        Property dictionaries are converted and stored as FluidProps.
+
         Args:
             vid (float): Vessel Inner Diameter, feet
             lss (float): Length Seam to Seam, feet
             leff (float): Vessel Effective Length, feet
             hliq (float): Height of the Liquid in Vessel, feet
-            liq_props (dict): Liquid Properties
-            gas_props (dict): Gas Properties
+            liq_props (dict | FluidProps): Liquid Properties
+            gas_props (dict | FluidProps): Gas Properties
         """
+        liq_props = fld.to_fluid_props(liq_props)
+        gas_props = fld.to_fluid_props(gas_props)
 
-        req_keys = {"mass_flow", "density", "viscosity"}
-        fld.validate_props(liq_props, req_keys)
-        fld.validate_props(gas_props, req_keys)
-
-        self.vid = vid
-        self.lss = lss
+        super().__init__(vid, lss)
         self.leff = leff
         self.hliq = hliq
         self.liq_props = liq_props
         self.gas_props = gas_props
+        self._mu_liq_lbm = drp.centipoise_to_lbm(float(liq_props.viscosity))  # proper units, props are frozen
+        self._mu_gas_lbm = drp.centipoise_to_lbm(float(gas_props.viscosity))
+
+        geom = self.geom
+        self.g = _GRAVITY
+        # float() the inputs, the compiled kernel signatures take float64 and reject 0-d arrays
+        (
+            self.aliq,
+            self.agas,
+            self.vx_liq,
+            self.vx_gas,
+            self.ret_liq,
+            self.ret_gas,
+            self.re_liq,
+            self.re_gas,
+            self.drop_liq,
+        ) = _two_phase_core(
+            geom.vid,
+            geom.r,
+            geom.atot,
+            geom.pm_tot,
+            float(leff),
+            float(hliq),
+            float(liq_props.mass_flow),
+            float(liq_props.density),
+            self._mu_liq_lbm,
+            float(gas_props.mass_flow),
+            float(gas_props.density),
+            self._mu_gas_lbm,
+            self.g,
+        )
 
-        aliq, agas = vessel_area_two_phase(vid, hliq)
-        dhyd_liq, dhyd_gas = vessel_dhyd_two_phase(vid, hliq)
-
-        qliq = fld.volm_flow(liq_props["mass_flow"], liq_props["density"])
-        qgas = fld.volm_flow(gas_props["mass_flow"], gas_props["density"])
-
-        vx_liq = fld.velocity_volm(qliq, aliq)
-        vx_gas = fld.velocity_volm(qgas, agas)
-
-        ret_liq = fld.retention(leff, vx_liq)
-        ret_gas = fld.retention(leff, vx_gas)
-
-        mu_liq = drp.centipoise_to_lbm(liq_props["viscosity"])  # proper units
-        mu_gas = drp.centipoise_to_lbm(gas_props["viscosity"])
-
-        re_liq = fld.reynolds(vx_liq, liq_props["density"], dhyd_liq, mu_liq)
-        re_gas = fld.reynolds(vx_gas, gas_props["density"], dhyd_gas, mu_gas)
-
-        dh_gas = vid - hliq  # differential height of gas
-        vt_gas_req = dh_gas / (ret_gas * 60)  # used to calculate smallest droplet that can come out of gravity
+    @classmethod
+    def batch(
+        cls,
+        vid: np.ndarray,
+        leff: np.ndarray,
+        hliq: np.ndarray,
+        liq_props: dict | fld.FluidProps | np.recarray,
+        gas_props: dict | fld.FluidProps | np.recarray,
+    ) -> dict[str, np.ndarray]:
+        """Two Phase Separator Sizing across Arrays
+
+        Same calculations as the constructor for a whole grid of vessels in one
+        vectorized pass, no separator objects are built. Dimensions broadcast
+        against each other. The fluid properties are either shared by every vessel
+        or given per vessel as a structured array, see fluids.fluid_props_array.
 
-        g = 32.174  # ft/s2
-        drop_liq = drp.droplet_diameter(vt_gas_req, liq_props["density"], gas_props["density"], mu_gas, g)
+        Args:
+            vid (np.ndarray): Vessel Inner Diameter, feet
+            leff (np.ndarray): Vessel Effective Length, feet
+            hliq (np.ndarray): Height of the Liquid in Vessel, feet
+            liq_props (dict | FluidProps | np.recarray): Liquid Properties
+            gas_props (dict | FluidProps | np.recarray): Gas Properties
 
-        self.g = g
-        self.aliq, self.agas = aliq, agas
-        self.vx_liq, self.vx_gas = vx_liq, vx_gas
-        self.re_liq, self.re_gas = re_liq, re_gas
-        self.ret_liq, self.ret_gas = ret_liq, ret_gas
-        self.drop_liq = drp.feet_to_micron(drop_liq)
+        Returns:
+            results (dict[str, np.ndarray]): aliq, agas, vx_liq, vx_gas, ret_liq, ret_gas,
+                re_liq, re_gas and drop_liq, keyed by their attribute names
+        """
+        liq_props = fld.to_batch_props(liq_props)
+        gas_props = fld.to_batch_props(gas_props)
+        dims = (vid, leff, hliq, liq_props.mass_flow, gas_props.mass_flow)
+        shape = np.broadcast_shapes(*(np.shape(x) for x in dims))  # per vessel properties set the shape too
+        vid, leff, hliq = (np.broadcast_to(np.asarray(x, dtype=float), shape) for x in (vid, leff, hliq))
+
+        aliq, agas = vessel_area_two_phase_np(vid, hliq)
+        dhyd_liq, dhyd_gas = vessel_dhyd_two_phase_np(vid, hliq)
+
+        vx_liq = liq_props.mass_flow * fld._INV_3600 / (liq_props.density * aliq)  # ft/s
+        vx_gas = gas_props.mass_flow * fld._INV_3600 / (gas_props.density * agas)
+
+        ret_liq = leff / vx_liq * fld._INV_60  # minutes
+        ret_gas = leff / vx_gas * fld._INV_60
+
+        mu_liq = drp.centipoise_to_lbm(liq_props.viscosity)  # lbm/(ft*s)
+        mu_gas = drp.centipoise_to_lbm(gas_props.viscosity)
+
+        re_liq = liq_props.density * vx_liq * dhyd_liq / mu_liq
+        re_gas = gas_props.density * vx_gas * dhyd_gas / mu_gas
+
+        vt_gas_req = (vid - hliq) * vx_gas / leff  # smallest droplet that can come out of gravity
+        drop_liq = drp.droplet_diameter_batch(vt_gas_req, liq_props.density, gas_props.density, mu_gas, _GRAVITY)
+
+        return {
+            "aliq": aliq,
+            "agas": agas,
+            "vx_liq": vx_liq,
+            "vx_gas": vx_gas,
+            "ret_liq": ret_liq,
+            "ret_gas": ret_gas,
+            "re_liq": re_liq,
+            "re_gas": re_gas,
+            "drop_liq": drp.feet_to_micron(drop_liq),
+        }
 
     def results(self) -> None:
         """Show Results of the Two Phase Separator"""
@@ -123,20 +251,16 @@ class SepTwoPhase(SepMech):
         labels = ["X-Area", "Velocity", "Retention", "Reynolds", "Min_Drop"]
         units = ["ft2", "ft/s", "min", "none", "µm"]
 
-        liq_results = [self.aliq, self.vx_liq, self.ret_liq, self.re_liq, np.nan]
+        liq_results = [self.aliq, self.vx_liq, self.ret_liq, self.re_liq, "-"]
         gas_results = [self.agas, self.vx_gas, self.ret_gas, self.re_gas, self.drop_liq]
 
-        sformat = "{:>9} | {:>8} | {:>8} | {:>8} \n"  # string format
-        nformat = "{:>9} | {:>8} | {:>8.2f} | {:>8.2f} \n"  # number format
-        re_format = "{:>9} | {:>8} | {:>8.0f} | {:>8.0f} \n"  # reynolds format
-        spc = 43 * "-" + "\n"  # spacing
-        pout = sformat.format("Tags", "Units", "Liquid", "Vapor") + spc
-        for label, unit, liq, gas in zip(labels, units, liq_results, gas_results):
-            if label == "Reynolds":
-                pout += re_format.format(label, unit, liq, gas)
-            else:
-                pout += nformat.format(label, unit, liq, gas)
-        print(pout)
+        specs = (".2f", ".2f", ".2f", ".0f", ".2f")  # number format parallel to labels, reynolds as whole numbers
+        lines = [f"{'Tags':>9} | {'Units':>8} | {'Liquid':>8} | {'Vapor':>8} \n", 43 * "-" + "\n"]
+        lines += [
+            f"{label:>9} | {unit:>8} | {_cell(liq, fs)} | {_cell(gas, fs)} \n"
+            for fs, label, unit, liq, gas in zip(specs, labels, units, liq_results, gas_results)
+        ]
+        print("".join(lines))
 
     def terminal_lig(self, dm: float) -> float:
         """Terminal Velocity of Liquid in Gas
@@ -148,12 +272,56 @@ class SepTwoPhase(SepMech):
             vt_liq (float): Terminal Velocity of Liquid in Gas, ft/s
         """
         dd = drp.micron_to_feet(dm)
-        mu_gas = drp.centipoise_to_lbm(self.gas_props["viscosity"])
-        vt_liq = drp.velocity_terminal(dd, self.liq_props["density"], self.gas_props["density"], mu_gas, self.g)
+        vt_liq = drp.velocity_terminal(dd, self.liq_props.density, self.gas_props.density, self._mu_gas_lbm, self.g)
         return vt_liq
 
+    def terminal_lig_batch(self, dm: np.ndarray) -> np.ndarray:
+        """Terminal Velocity of Liquid in Gas for an Array of Droplets
+
+        Args:
+            dm (np.ndarray): Droplet Diameters, micron
+
+        Returns:
+            vt_liq (np.ndarray): Terminal Velocity of Liquid in Gas, ft/s
+        """
+        dm = np.asarray(dm, dtype=float)
+        rho_liq, rho_gas, mu_gas = self.liq_props.density, self.gas_props.density, self._mu_gas_lbm
+        if HAS_NUMBA:  # compiled loop over the scalar solver
+            vt_liq = _terminal_velocity_array(dm.ravel(), rho_liq, rho_gas, mu_gas, self.g)
+        else:
+            vt_liq = drp.velocity_terminal_batch(drp.micron_to_feet(dm.ravel()), rho_liq, rho_gas, mu_gas, self.g)
+        return vt_liq.reshape(dm.shape)
+
 
 class SepThreePhase(SepMech):
+    __slots__ = (
+        "_mu_gas_lbm",
+        "_mu_oil_lbm",
+        "_mu_wat_lbm",
+        "agas",
+        "aoil",
+        "awat",
+        "drop_oig",
+        "drop_oiw",
+        "drop_wio",
+        "g",
+        "gas_props",
+        "hoil",
+        "hwat",
+        "leff",
+        "oil_props",
+        "re_gas",
+        "re_oil",
+        "re_wat",
+        "ret_gas",
+        "ret_oil",
+        "ret_wat",
+        "vx_gas",
+        "vx_oil",
+        "vx_wat",
+        "wat_props",
+    )
+
     def __init__(
         self,
         vid: float,
@@ -161,80 +329,133 @@ class SepThreePhase(SepMech):
         leff: float,
         hoil: float,
         hwat: float,
-        oil_props: dict,  # make these classes?
-        wat_props: dict,
-        gas_props: dict,
+        oil_props: dict | fld.FluidProps,
+        wat_props: dict | fld.FluidProps,
+        gas_props: dict | fld.FluidProps,
     ) -> None:
         """Two Phase Separator of Gas and Liquid
 
+        Property dictionaries are converted and stored as FluidProps.
+
         Args:
             vid (float): Vessel Inner Diameter, feet
             lss (float): Length Seam to Seam, feet
             leff (float): Vessel Effective Length, feet
             hoil (float): Height of the Oil in Vessel, feet
             hwat (float): Height of the Water in Vessel, feet
-            oil_props (dict): Oil Properties
-            wat_props (dict): Water Properties
-            gas_props (dict): Gas Properties
+            oil_props (dict | FluidProps): Oil Properties
+            wat_props (dict | FluidProps): Water Properties
+            gas_props (dict | FluidProps): Gas Properties
         """
+        oil_props = fld.to_fluid_props(oil_props)
+        wat_props = fld.to_fluid_props(wat_props)
+        gas_props = fld.to_fluid_props(gas_props)
 
-        req_keys = {"mass_flow", "density", "viscosity"}
-        fld.validate_props(oil_props, req_keys)
-        fld.validate_props(wat_props, req_keys)
-        fld.validate_props(gas_props, req_keys)
-
-        self.vid = vid
-        self.lss = lss
+        super().__init__(vid, lss)
         self.leff = leff
         self.hoil = hoil
         self.hwat = hwat
         self.oil_props = oil_props
         self.wat_props = wat_props
         self.gas_props = gas_props
+        self._mu_oil_lbm = drp.centipoise_to_lbm(float(oil_props.viscosity))  # proper units, props are frozen
+        self._mu_wat_lbm = drp.centipoise_to_lbm(float(wat_props.viscosity))
+        self._mu_gas_lbm = drp.centipoise_to_lbm(float(gas_props.viscosity))
+
+        geom = self.geom
+        self.g = _GRAVITY
+        # float() the inputs, the compiled kernel signatures take float64 and reject 0-d arrays
+        (
+            self.aoil,
+            self.awat,
+            self.agas,
+            self.vx_oil,
+            self.vx_wat,
+            self.vx_gas,
+            self.ret_oil,
+            self.ret_wat,
+            self.ret_gas,
+            self.re_oil,
+            self.re_wat,
+            self.re_gas,
+            self.drop_oiw,
+            self.drop_wio,
+            self.drop_oig,
+        ) = _three_phase_core(
+            geom.vid,
+            geom.r,
+            geom.atot,
+            geom.pm_tot,
+            float(leff),
+            float(hoil),
+            float(hwat),
+            float(oil_props.mass_flow),
+            float(oil_props.density),
+            self._mu_oil_lbm,
+            float(wat_props.mass_flow),
+            float(wat_props.density),
+            self._mu_wat_lbm,
+            float(gas_props.mass_flow),
+            float(gas_props.density),
+            self._mu_gas_lbm,
+            self.g,
+        )
 
-        aoil, awat, agas = vessel_area_three_phase(vid, hoil, hwat)
-        dhyd_oil, dhyd_wat, dhyd_gas = vessel_dhyd_three_phase(vid, hoil, hwat)
-
-        qoil = fld.volm_flow(oil_props["mass_flow"], oil_props["density"])
-        qwat = fld.volm_flow(wat_props["mass_flow"], wat_props["density"])
-        qgas = fld.volm_flow(gas_props["mass_flow"], gas_props["density"])
-
-        vx_oil = fld.velocity_volm(qoil, aoil)
-        vx_wat = fld.velocity_volm(qwat, awat)
-        vx_gas = fld.velocity_volm(qgas, agas)
-
-        ret_oil = fld.retention(leff, vx_oil)
-        ret_wat = fld.retention(leff, vx_wat)
-        ret_gas = fld.retention(leff, vx_gas)
-
-        mu_oil = drp.centipoise_to_lbm(oil_props["viscosity"])  # proper units
-        mu_wat = drp.centipoise_to_lbm(wat_props["viscosity"])
-        mu_gas = drp.centipoise_to_lbm(gas_props["viscosity"])
-
-        re_oil = fld.reynolds(vx_oil, oil_props["density"], dhyd_oil, mu_oil)
-        re_wat = fld.reynolds(vx_wat, wat_props["density"], dhyd_wat, mu_wat)
-        re_gas = fld.reynolds(vx_gas, gas_props["density"], dhyd_gas, mu_gas)
-
-        dh_gas = vid - hoil  # differential height of gas
-        dh_oil = hoil - hwat  # differential height of oil
-
-        vt_oiw_req = hwat / (ret_wat * 60)  # terminal velocity required for oil in water
-        vt_wio_req = dh_oil / (ret_oil * 60)  # terminal velocity required for water in oil
-        vt_oig_req = dh_gas / (ret_gas * 60)  # terminal velocity required for oil in gas
+    @classmethod
+    def sweep(
+        cls,
+        vid: np.ndarray,
+        leff: np.ndarray,
+        hoil: np.ndarray,
+        hwat: np.ndarray,
+        oil_props: dict | fld.FluidProps,
+        wat_props: dict | fld.FluidProps,
+        gas_props: dict | fld.FluidProps,
+    ) -> np.recarray:
+        """Three Phase Separator Sizing across Arrays
+
+        Runs the compiled constructor kernel over every grid point in parallel with
+        numba.prange, no separator objects are built. Dimensions broadcast against
+        each other, the fluid properties are shared by every vessel. Thread count
+        follows NUMBA_NUM_THREADS, set NUMBA_THREADING_LAYER to tbb or omp for the
+        better schedulers. Without numba the same loop runs serially in python.
 
-        g = 32.174  # ft/s2
-        drop_oiw = drp.droplet_diameter(vt_oiw_req, oil_props["density"], wat_props["density"], mu_wat, g)
-        drop_wio = drp.droplet_diameter(vt_wio_req, wat_props["density"], oil_props["density"], mu_oil, g)
-        drop_oig = drp.droplet_diameter(vt_oig_req, oil_props["density"], gas_props["density"], mu_gas, g)
+        Args:
+            vid (np.ndarray): Vessel Inner Diameter, feet
+            leff (np.ndarray): Vessel Effective Length, feet
+            hoil (np.ndarray): Height of the Oil in Vessel, feet
+            hwat (np.ndarray): Height of the Water in Vessel, feet
+            oil_props (dict | FluidProps): Oil Properties
+            wat_props (dict | FluidProps): Water Properties
+            gas_props (dict | FluidProps): Gas Properties
 
-        self.g = g
-        self.aoil, self.awat, self.agas = aoil, awat, agas
-        self.vx_oil, self.vx_wat, self.vx_gas = vx_oil, vx_wat, vx_gas
-        self.re_oil, self.re_wat, self.re_gas = re_oil, re_wat, re_gas
-        self.ret_oil, self.ret_wat, self.ret_gas = ret_oil, ret_wat, ret_gas
-        self.drop_oiw = drp.feet_to_micron(drop_oiw)
-        self.drop_wio = drp.feet_to_micron(drop_wio)
-        self.drop_oig = drp.feet_to_micron(drop_oig)
+        Returns:
+            results (np.recarray): One field per result attribute, aoil through drop_oig
+        """
+        oil_props = fld.to_fluid_props(oil_props)
+        wat_props = fld.to_fluid_props(wat_props)
+        gas_props = fld.to_fluid_props(gas_props)
+        dims = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (vid, leff, hoil, hwat)))
+        vid, leff, hoil, hwat = (np.ascontiguousarray(x).ravel() for x in dims)
+        _check_three_phase_np(vid, hoil, hwat)  # raise before entering the threads
+
+        out = _three_phase_sweep(
+            vid,
+            leff,
+            hoil,
+            hwat,
+            oil_props.mass_flow,
+            oil_props.density,
+            drp.centipoise_to_lbm(oil_props.viscosity),
+            wat_props.mass_flow,
+            wat_props.density,
+            drp.centipoise_to_lbm(wat_props.viscosity),
+            gas_props.mass_flow,
+            gas_props.density,
+            drp.centipoise_to_lbm(gas_props.viscosity),
+            _GRAVITY,
+        )
+        return out.view(_THREE_PHASE_DTYPE).reshape(dims[0].shape).view(np.recarray)
 
     def results(self) -> None:
         """Show Results of the Two Phase Separator"""
@@ -242,21 +463,17 @@ class SepThreePhase(SepMech):
         labels = ["X-Area", "Velocity", "Retention", "Reynolds", "Oil Min Drop", "Wat Min Drop", "Gas Min Drop"]
         units = ["ft2", "ft/s", "min", "none", "µm", "µm", "µm"]
 
-        oil_results = [self.aoil, self.vx_oil, self.ret_oil, self.re_oil, np.nan, self.drop_wio, np.nan]
-        wat_results = [self.awat, self.vx_wat, self.ret_wat, self.re_wat, self.drop_oiw, np.nan, np.nan]
-        gas_results = [self.agas, self.vx_gas, self.ret_gas, self.re_gas, self.drop_oig, np.nan, np.nan]
-
-        sformat = "{:>12} | {:>5} | {:>8} | {:>8} | {:>8} \n"  # string format
-        nformat = "{:>12} | {:>5} | {:>8.2f} | {:>8.2f} | {:>8.2f} \n"  # number format
-        re_format = "{:>12} | {:>5} | {:>8.0f} | {:>8.0f} | {:>8.0f} \n"  # reynolds format
-        spc = 54 * "-" + "\n"  # spacing
-        pout = sformat.format("Tags", "Units", "Oil", "Water", "Vapor") + spc
-        for label, unit, oil, wat, gas in zip(labels, units, oil_results, wat_results, gas_results):
-            if label == "Reynolds":
-                pout += re_format.format(label, unit, oil, wat, gas)
-            else:
-                pout += nformat.format(label, unit, oil, wat, gas)
-        print(pout)
+        oil_results = [self.aoil, self.vx_oil, self.ret_oil, self.re_oil, "-", self.drop_wio, "-"]
+        wat_results = [self.awat, self.vx_wat, self.ret_wat, self.re_wat, self.drop_oiw, "-", "-"]
+        gas_results = [self.agas, self.vx_gas, self.ret_gas, self.re_gas, self.drop_oig, "-", "-"]
+
+        specs = (".2f", ".2f", ".2f", ".0f", ".2f", ".2f", ".2f")  # number format parallel to labels
+        lines = [f"{'Tags':>12} | {'Units':>5} | {'Oil':>8} | {'Water':>8} | {'Vapor':>8} \n", 54 * "-" + "\n"]
+        lines += [
+            f"{label:>12} | {unit:>5} | {_cell(oil, fs)} | {_cell(wat, fs)} | {_cell(gas, fs)} \n"
+            for fs, label, unit, oil, wat, gas in zip(specs, labels, units, oil_results, wat_results, gas_results)
+        ]
+        print("".join(lines))
 
     def coal_plate_length(self, dm: float, pgap: float = 0.75, angl: float = 45, pf: float = 0.6) -> float:
         """Coalescing Plate Length
@@ -277,15 +494,72 @@ class SepThreePhase(SepMech):
         dd = drp.micron_to_feet(dm)
         vt_oil = drp.velocity_terminal(
             dd,
-            self.oil_props["density"],
-            self.wat_props["density"],
-            drp.centipoise_to_lbm(self.wat_props["viscosity"]),
-            32.174,
+            self.oil_props.density,
+            self.wat_props.density,
+            self._mu_wat_lbm,
+            self.g,
         )
         coal_len = drp.coal_plate_length(vt_oil, self.vx_wat, pgap=pgap, angl=angl, pf=pf)
 
         if coal_len > self.leff:
-            print(f"Plates are too long: {round(coal_len, 2)} ft vs Leff {round(self.leff)} ft")
+            print(f"Plates are too long: {coal_len:.2f} ft vs Leff {self.leff:.0f} ft")
             coal_len = np.nan
 
         return coal_len
+
+
+@lru_cache(maxsize=64)
+def make_two_phase(
+    vid: float, lss: float, leff: float, hliq: float, liq_props: fld.FluidProps, gas_props: fld.FluidProps
+) -> SepTwoPhase:
+    """Cached Two Phase Separator
+
+    Repeated calls with the same geometry and properties return the same instance
+    instead of re-solving the separator. Properties must be FluidProps, dictionaries
+    are not hashable. The returned separator is shared, do not modify its attributes.
+
+    Args:
+        vid (float): Vessel Inner Diameter, feet
+        lss (float): Length Seam to Seam, feet
+        leff (float): Vessel Effective Length, feet
+        hliq (float): Height of the Liquid in Vessel, feet
+        liq_props (FluidProps): Liquid Properties
+        gas_props (FluidProps): Gas Properties
+
+    Returns:
+        sep (SepTwoPhase): Two Phase Separator
+    """
+    return SepTwoPhase(vid, lss, leff, hliq, liq_props, gas_props)
+
+
+@lru_cache(maxsize=64)
+def make_three_phase(
+    vid: float,
+    lss: float,
+    leff: float,
+    hoil: float,
+    hwat: float,
+    oil_props: fld.FluidProps,
+    wat_props: fld.FluidProps,
+    gas_props: fld.FluidProps,
+) -> SepThreePhase:
+    """Cached Three Phase Separator
+
+    Repeated calls with the same geometry and properties return the same instance
+    instead of re-solving the separator. Properties must be FluidProps, dictionaries
+    are not hashable. The returned separator is shared, do not modify its attributes.
+
+    Args:
+        vid (float): Vessel Inner Diameter, feet
+        lss (float): Length Seam to Seam, feet
+        leff (float): Vessel Effective Length, feet
+        hoil (float): Height of the Oil in Vessel, feet
+        hwat (float): Height of the Water in Vessel, feet
+        oil_props (FluidProps): Oil Properties
+        wat_props (FluidProps): Water Properties
+        gas_props (FluidProps): Gas Properties
+
+    Returns:
+        sep (SepThreePhase): Three Phase Separator
+    """
+    return SepThreePhase(vid, lss, leff, hoil, hwat, oil_props, wat_props, gas_props)
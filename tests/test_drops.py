@@ -0,0 +1,141 @@
+"""Droplet Solver Tests
+
+Newton solvers against the fixed point fallbacks, compiled against plain python
+and the vectorized batch solvers against the scalar solvers.
+"""
+
+import unittest
+
+import numpy as np
+
+import pysep.drops as drp
+from pysep._jit import HAS_NUMBA
+
+G = 32.174  # ft/s2
+
+# droplet density, continuous phase density, continuous phase viscosity lbm/(ft*s)
+CASES = [
+    (57.57, 2.05, drp.centipoise_to_lbm(0.0125)),  # oil in gas
+    (57.57, 60.79, drp.centipoise_to_lbm(0.5)),  # oil in water
+    (60.79, 57.57, drp.centipoise_to_lbm(5.0)),  # water in oil
+]
+DIAMETERS = [10, 50, 150, 500, 2000]  # micron
+
+
+class TestNewtonFixedPoint(unittest.TestCase):
+    def test_velocity_terminal(self):
+        for rho_drop, rho_fld, mu_fld in CASES:
+            for dm in DIAMETERS:
+                dd = drp.micron_to_feet(dm)
+                newt = drp.velocity_terminal(dd, rho_drop, rho_fld, mu_fld, G, 1e-12)
+                fixd = drp._velocity_terminal_fixed(dd, rho_drop, rho_fld, mu_fld, G, 1e-12)
+                self.assertAlmostEqual(newt / fixd, 1, places=8)
+
+    def test_droplet_diameter(self):
+        for rho_drop, rho_fld, mu_fld in CASES:
+            for dm in DIAMETERS:
+                vt = drp.velocity_terminal(drp.micron_to_feet(dm), rho_drop, rho_fld, mu_fld, G, 1e-12)
+                newt = drp.droplet_diameter(vt, rho_drop, rho_fld, mu_fld, G, 1e-14)
+                fixd = drp._droplet_diameter_fixed(vt, rho_drop, rho_fld, mu_fld, G, 1e-14)
+                self.assertAlmostEqual(newt / fixd, 1, places=8)
+                self.assertAlmostEqual(drp.feet_to_micron(newt) / dm, 1, places=6)  # inverse of velocity
+
+    def test_zero_driving_force(self):
+        self.assertEqual(drp.velocity_terminal(drp.micron_to_feet(100), 50, 50, 1e-5, G), 0)
+        self.assertEqual(drp.droplet_diameter(0, 57.57, 2.05, 1e-5, G), 0)
+
+
+class TestConvergence(unittest.TestCase):
+    # 150 micron oil droplet settling through water, the primary.py coalescing plate droplet
+    ARGS = (drp.micron_to_feet(150), 57.57, 60.793, drp.centipoise_to_lbm(0.75), G)
+
+    def bisect_velocity(self) -> float:
+        dd, rho_drop, rho_fld, mu_fld, g = self.ARGS
+        lo, hi = 1e-8, 1.0  # velocity_drop at the guess is above the guess below the root
+        for _ in range(200):
+            mid = 0.5 * (lo + hi)
+            cd = drp.drag_coeff(drp.reynolds_sphere(dd, mid, rho_fld, mu_fld))
+            if drp.velocity_drop(dd, cd, rho_drop, rho_fld, g) > mid:
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    def test_bisection_reference(self):
+        root = self.bisect_velocity()
+        self.assertAlmostEqual(root, 0.00263, places=5)
+        self.assertAlmostEqual(drp.velocity_terminal(*self.ARGS) / root, 1, places=3)  # default tol
+        self.assertAlmostEqual(drp.velocity_terminal(*self.ARGS, 1e-12) / root, 1, places=9)
+
+    def test_tolerance(self):
+        tight = drp.velocity_terminal(*self.ARGS, 1e-12)
+        for tol in (1e-3, 1e-5, 1e-8):
+            self.assertLess(abs(drp.velocity_terminal(*self.ARGS, tol) - tight), tol)
+
+    def test_max_iter_raises(self):
+        vt = drp.velocity_terminal(*self.ARGS, 1e-12)
+        rest = self.ARGS[1:]
+        with self.assertRaises(RuntimeError):
+            drp.velocity_terminal(*self.ARGS, 0, 1)
+        with self.assertRaises(RuntimeError):
+            drp._velocity_terminal_fixed(*self.ARGS, 0, 1)
+        with self.assertRaises(RuntimeError):
+            drp.droplet_diameter(vt, *rest, 0, 1)
+        with self.assertRaises(RuntimeError):
+            drp._droplet_diameter_fixed(vt, *rest, 0, 1)
+        with self.assertRaises(RuntimeError):
+            drp.velocity_terminal_batch(*self.ARGS, 0, 1)
+        with self.assertRaises(RuntimeError):
+            drp.droplet_diameter_batch(vt, *rest, 0, 1)
+
+
+@unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+class TestCompiledPython(unittest.TestCase):
+    def test_velocity_terminal(self):
+        for rho_drop, rho_fld, mu_fld in CASES:
+            for dm in DIAMETERS:
+                args = (drp.micron_to_feet(dm), rho_drop, rho_fld, mu_fld, G)
+                self.assertAlmostEqual(drp.velocity_terminal(*args), drp.velocity_terminal.py_func(*args), places=12)
+
+    def test_droplet_diameter(self):
+        for rho_drop, rho_fld, mu_fld in CASES:
+            for vt in [0.01, 0.1, 1.0]:
+                args = (vt, rho_drop, rho_fld, mu_fld, G)
+                self.assertAlmostEqual(drp.droplet_diameter(*args), drp.droplet_diameter.py_func(*args), places=12)
+
+
+class TestBatchScalar(unittest.TestCase):
+    def test_velocity_terminal_batch(self):
+        dd = drp.micron_to_feet(np.array(DIAMETERS, dtype=float))
+        for rho_drop, rho_fld, mu_fld in CASES:
+            vt = drp.velocity_terminal_batch(dd, rho_drop, rho_fld, mu_fld, G, 1e-12)
+            vt_ref = [drp.velocity_terminal(d, rho_drop, rho_fld, mu_fld, G, 1e-12) for d in dd]
+            np.testing.assert_allclose(vt, vt_ref, rtol=1e-9)
+
+    def test_droplet_diameter_batch(self):
+        vt = np.array([0.01, 0.05, 0.1, 0.5, 1.0])
+        for rho_drop, rho_fld, mu_fld in CASES:
+            dd = drp.droplet_diameter_batch(vt, rho_drop, rho_fld, mu_fld, G, 1e-14)
+            dd_ref = [drp.droplet_diameter(v, rho_drop, rho_fld, mu_fld, G, 1e-14) for v in vt]
+            np.testing.assert_allclose(dd, dd_ref, rtol=1e-9)
+
+    def test_scalar_inputs(self):
+        for rho_drop, rho_fld, mu_fld in CASES:
+            dd = drp.micron_to_feet(150)
+            vt = drp.velocity_terminal_batch(dd, rho_drop, rho_fld, mu_fld, G, 1e-12)
+            self.assertEqual(vt.shape, ())
+            self.assertAlmostEqual(vt / drp.velocity_terminal(dd, rho_drop, rho_fld, mu_fld, G, 1e-12), 1, places=9)
+
+            dd = drp.droplet_diameter_batch(0.1, rho_drop, rho_fld, mu_fld, G, 1e-14)
+            self.assertEqual(dd.shape, ())
+            self.assertAlmostEqual(dd / drp.droplet_diameter(0.1, rho_drop, rho_fld, mu_fld, G, 1e-14), 1, places=9)
+
+    def test_broadcast_properties(self):
+        dd = drp.micron_to_feet(np.array([[100.0], [300.0]]))
+        rho_fld = np.array([1.5, 2.0, 2.5])
+        vt = drp.velocity_terminal_batch(dd, 57.57, rho_fld, 1e-5, G)
+        self.assertEqual(vt.shape, (2, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
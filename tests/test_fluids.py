@@ -0,0 +1,68 @@
+"""Fluid Property Array Tests
+
+fluid_props_array and to_batch_props against the per stream FluidProps, and the
+batch sizing with one stream per vessel against separators built one at a time.
+"""
+
+import unittest
+from dataclasses import replace
+
+import numpy as np
+
+import pysep.fluids as fld
+from pysep.fluid_presets import GAS_DEMISTER, OIL_STD
+from pysep.separator import SepTwoPhase
+
+STREAMS = [
+    replace(OIL_STD, mass_flow=1e5),
+    replace(OIL_STD, mass_flow=2e5, density=57.57, viscosity=10),
+    {"mass_flow": 3e5, "density": 59.42, "viscosity": 152, "drop_io": np.nan, "drop_iw": 200, "drop_ig": 100},
+]
+GAS = replace(GAS_DEMISTER, mass_flow=3928)
+
+
+class TestFluidPropsArray(unittest.TestCase):
+    def test_round_trip(self):
+        arr = fld.fluid_props_array(STREAMS)
+        self.assertEqual(arr.dtype, fld.FLUID_DTYPE)
+        self.assertEqual(arr.shape, (len(STREAMS),))
+        for row, props in zip(arr, map(fld.to_fluid_props, STREAMS)):
+            self.assertEqual(fld.FluidProps(*row), fld.FluidProps(props.mass_flow, props.density, props.viscosity))
+
+    def test_to_batch_props(self):
+        arr = fld.fluid_props_array(STREAMS)
+        fluid = fld.to_batch_props(arr)
+        for name in fld.FLUID_DTYPE.names:
+            expected = [getattr(fld.to_fluid_props(p), name) for p in STREAMS]
+            np.testing.assert_array_equal(getattr(fluid, name), expected)
+        self.assertIs(fld.to_batch_props(GAS), GAS)
+        np.testing.assert_array_equal(fld.fluid_props_array(arr), arr)  # structured arrays are checked, not rebuilt
+
+    def test_missing_fields(self):
+        plain = np.array([[1e5, 50, 1.0], [2e5, 55, 2.0]])
+        for func in (fld.to_batch_props, fld.fluid_props_array):
+            with self.assertRaisesRegex(ValueError, "mass_flow"):
+                func(plain)
+        partial = np.zeros(2, dtype=[("mass_flow", "f8"), ("density", "f8")])
+        with self.assertRaisesRegex(ValueError, "viscosity"):
+            fld.to_batch_props(partial)
+
+    def test_bad_values(self):
+        arr = fld.fluid_props_array(STREAMS)
+        arr.density[1] = -1
+        with self.assertRaises(ValueError):
+            fld.to_batch_props(arr)
+
+
+class TestPerVesselBatch(unittest.TestCase):
+    def test_matches_constructor(self):
+        vid = np.array([6.0, 8.0, 10.0])
+        res = SepTwoPhase.batch(vid, 32, 0.5 * vid, fld.fluid_props_array(STREAMS), GAS)
+        for i, (d, props) in enumerate(zip(vid, STREAMS)):
+            sep = SepTwoPhase(d, 40, 32, 0.5 * d, props, GAS)
+            for name in ("aliq", "vx_liq", "ret_liq", "re_liq", "re_gas", "drop_liq"):
+                self.assertAlmostEqual(res[name][i] / getattr(sep, name), 1, places=7, msg=name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Vessel Geometry Tests
+
+The vectorized _np functions against the scalar functions they mirror, on both
+sides of the half full branch for every phase.
+"""
+
+import unittest
+
+import numpy as np
+
+import pysep.geometry as geo
+
+VID = 8.0  # feet, radius of 4
+HLIQ = [0.5, 2.0, 4.0, 6.0, 7.9]  # below, at and above half full
+# (hoil, hwat), naming the low or high branch taken by the water and the gas
+HOIL_HWAT = [
+    (3.5, 1.0),  # water low, gas high
+    (7.0, 2.0),  # water low, gas low
+    (7.0, 5.0),  # water high, gas low
+    (4.0, 4.0),  # water and gas at half full, no oil
+    (7.9, 6.5),  # thin gas layer above a high water level
+]
+
+
+class TestTwoPhaseArrays(unittest.TestCase):
+    def test_matches_scalar(self):
+        hliq = np.array(HLIQ)
+        for name in ("area", "perim", "dhyd"):
+            vec = getattr(geo, f"vessel_{name}_two_phase_np")(VID, hliq)
+            for i, h in enumerate(HLIQ):
+                with self.subTest(name=name, hliq=h):
+                    ref = getattr(geo, f"vessel_{name}_two_phase")(VID, h)
+                    np.testing.assert_allclose([v[i] for v in vec], ref, rtol=1e-12)
+
+    def test_too_full(self):
+        with self.assertRaises(ValueError):
+            geo.vessel_area_two_phase_np(VID, np.array([2.0, 9.0]))
+
+
+class TestThreePhaseArrays(unittest.TestCase):
+    def test_matches_scalar(self):
+        hoil, hwat = (np.array(x) for x in zip(*HOIL_HWAT))
+        for name in ("area", "perim", "dhyd"):
+            vec = getattr(geo, f"vessel_{name}_three_phase_np")(VID, hoil, hwat)
+            for i, (ho, hw) in enumerate(HOIL_HWAT):
+                with self.subTest(name=name, hoil=ho, hwat=hw):
+                    ref = getattr(geo, f"vessel_{name}_three_phase")(VID, ho, hw)
+                    np.testing.assert_allclose([v[i] for v in vec], ref, rtol=1e-12, atol=1e-12)
+
+    def test_broadcast(self):
+        vid = np.array([[6.0], [8.0], [10.0]])
+        aoil, awat, agas = geo.vessel_area_three_phase_np(vid, 0.7 * vid, np.array([1.0, 2.0]))
+        self.assertEqual(aoil.shape, (3, 2))
+        np.testing.assert_allclose(aoil + awat + agas, np.broadcast_to(np.pi * vid**2 / 4, (3, 2)), rtol=1e-12)
+
+    def test_bad_heights(self):
+        with self.assertRaises(ValueError):
+            geo.vessel_area_three_phase_np(VID, np.array([3.0, 5.0]), np.array([1.0, 6.0]))
+        with self.assertRaises(ValueError):
+            geo.vessel_dhyd_three_phase_np(VID, np.array([9.0]), np.array([1.0]))
+
+
+class TestNumpyScalarInputs(unittest.TestCase):
+    def test_scalar_functions(self):
+        for vid, h in ((np.array(10.0), np.array(5.0)), (np.float64(10), np.float32(2.5)), (np.int64(10), 7)):
+            with self.subTest(vid=vid, h=h):
+                np.testing.assert_allclose(geo.vessel_dhyd_two_phase(vid, h), geo.vessel_dhyd_two_phase(10.0, float(h)))
+                np.testing.assert_allclose(geo.vessel_area_two_phase(vid, h), geo.vessel_area_two_phase(10.0, float(h)))
+                np.testing.assert_allclose(
+                    geo.vessel_dhyd_three_phase(vid, 8.0, h), geo.vessel_dhyd_three_phase(10.0, 8.0, float(h))
+                )
+                np.testing.assert_allclose(geo.circle_segment_area(h / 2, vid / 2), geo.circle_segment_area(h / 2, 5.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Sizing Kernel Tests
+
+The kernels against the same sizing assembled from the public geometry and
+droplet functions, and the compiled kernels against their plain python source.
+"""
+
+import unittest
+from dataclasses import replace
+
+import numpy as np
+
+import pysep.drops as drp
+import pysep.geometry as geo
+from pysep._jit import HAS_NUMBA
+from pysep._kernels import _three_phase_core, _two_phase_core
+from pysep.fluid_presets import GAS_DEMISTER, OIL_STD, WAT_STD
+
+G = 32.174  # ft/s2
+
+OIL = replace(OIL_STD, mass_flow=3.509e5, density=57.57)
+WAT = replace(WAT_STD, mass_flow=1.482e6, density=60.793)
+GAS = replace(GAS_DEMISTER, mass_flow=3928)
+
+
+def _kernel_args(vid: float) -> tuple[float, float, float, float]:
+    geom = geo.VesselGeometry.from_vid(vid)
+    return geom.vid, geom.r, geom.atot, geom.pm_tot
+
+
+def _two_phase_args(vid: float, leff: float, hliq: float) -> tuple[float, ...]:
+    return (
+        *_kernel_args(vid),
+        leff,
+        hliq,
+        OIL.mass_flow,
+        OIL.density,
+        drp.centipoise_to_lbm(OIL.viscosity),
+        GAS.mass_flow,
+        GAS.density,
+        drp.centipoise_to_lbm(GAS.viscosity),
+        G,
+    )
+
+
+def _three_phase_args(vid: float, leff: float, hoil: float, hwat: float) -> tuple[float, ...]:
+    return (
+        *_kernel_args(vid),
+        leff,
+        hoil,
+        hwat,
+        OIL.mass_flow,
+        OIL.density,
+        drp.centipoise_to_lbm(OIL.viscosity),
+        WAT.mass_flow,
+        WAT.density,
+        drp.centipoise_to_lbm(WAT.viscosity),
+        GAS.mass_flow,
+        GAS.density,
+        drp.centipoise_to_lbm(GAS.viscosity),
+        G,
+    )
+
+
+class TestTwoPhaseCore(unittest.TestCase):
+    def test_public_functions(self):
+        vid, leff, hliq = 6.0, 16.0, 3.5
+        mu_gas = drp.centipoise_to_lbm(GAS.viscosity)
+        aliq, agas = geo.vessel_area_two_phase(vid, hliq)
+        _dhyd_liq, dhyd_gas = geo.vessel_dhyd_two_phase(vid, hliq)
+        vx_gas = GAS.mass_flow / (GAS.density * 3600 * agas)
+        vt_req = (vid - hliq) * vx_gas / leff
+        drop_liq = drp.feet_to_micron(drp.droplet_diameter(vt_req, OIL.density, GAS.density, mu_gas, G))
+
+        res = _two_phase_core(*_two_phase_args(vid, leff, hliq))
+        np.testing.assert_allclose(res[:2], (aliq, agas), rtol=1e-12)
+        np.testing.assert_allclose(res[3], vx_gas, rtol=1e-12)
+        np.testing.assert_allclose(res[7], GAS.density * vx_gas * dhyd_gas / mu_gas, rtol=1e-12)
+        np.testing.assert_allclose(res[8], drop_liq, rtol=1e-9)
+
+    @unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+    def test_compiled_python(self):
+        args = _two_phase_args(6.0, 16.0, 3.5)
+        np.testing.assert_allclose(_two_phase_core(*args), _two_phase_core.py_func(*args), rtol=1e-12)
+
+
+class TestThreePhaseCore(unittest.TestCase):
+    def test_public_functions(self):
+        vid, leff, hoil, hwat = 9.5, 36.0, 7.6, 6.175
+        mu_wat = drp.centipoise_to_lbm(WAT.viscosity)
+        aoil, awat, agas = geo.vessel_area_three_phase(vid, hoil, hwat)
+        vx_wat = WAT.mass_flow / (WAT.density * 3600 * awat)
+        drop_oiw = drp.feet_to_micron(drp.droplet_diameter(hwat * vx_wat / leff, OIL.density, WAT.density, mu_wat, G))
+
+        res = _three_phase_core(*_three_phase_args(vid, leff, hoil, hwat))
+        np.testing.assert_allclose(res[:3], (aoil, awat, agas), rtol=1e-12)
+        np.testing.assert_allclose(res[7], leff / (vx_wat * 60), rtol=1e-12)
+        np.testing.assert_allclose(res[12], drop_oiw, rtol=1e-9)
+
+    @unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+    def test_compiled_python(self):
+        args = _three_phase_args(9.5, 36.0, 7.6, 6.175)
+        np.testing.assert_allclose(_three_phase_core(*args), _three_phase_core.py_func(*args), rtol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Separator Array Method Tests
+
+The array methods against separators built one at a time.
+"""
+
+import unittest
+from dataclasses import replace
+
+import numpy as np
+
+from pysep.fluid_presets import GAS_DEMISTER, OIL_STD, WAT_STD
+from pysep.fluids import FluidProps
+from pysep.separator import SepThreePhase, SepTwoPhase, make_two_phase
+
+LIQ = replace(OIL_STD, mass_flow=3.509e5, density=57.57)
+WAT = replace(WAT_STD, mass_flow=1.482e6, density=60.793)
+GAS = replace(GAS_DEMISTER, mass_flow=3928)
+TWO_PHASE = ("aliq", "agas", "vx_liq", "vx_gas", "ret_liq", "ret_gas", "re_liq", "re_gas", "drop_liq")
+
+
+class TestConstruction(unittest.TestCase):
+    def test_dict_props(self):
+        sep = SepTwoPhase(10, 40, 32, 5, {"mass_flow": 3.509e5, "density": 57.57, "viscosity": 52}, GAS)
+        self.assertIsInstance(sep.liq_props, FluidProps)
+        self.assertAlmostEqual(sep.drop_liq, SepTwoPhase(10, 40, 32, 5, LIQ, GAS).drop_liq, places=12)
+
+    def test_cached_factory(self):
+        sep = make_two_phase(10, 40, 32, 5, LIQ, GAS)
+        self.assertIs(make_two_phase(10, 40, 32, 5, LIQ, GAS), sep)
+        self.assertAlmostEqual(sep.drop_liq, SepTwoPhase(10, 40, 32, 5, LIQ, GAS).drop_liq, places=12)
+
+
+class TestMechanicalArrays(unittest.TestCase):
+    def test_shell_thick(self):
+        sep = SepThreePhase(10, 40, 32, 7, 3, LIQ, WAT, GAS)
+        mawp = [100.0, 285.0, 740.0, 1440.0]
+        thk = sep.shell_thick(np.array(mawp), sv=17500, eff=0.85)
+        self.assertEqual(thk.shape, (4,))
+        for i, p in enumerate(mawp):
+            self.assertAlmostEqual(thk[i], sep.shell_thick(p, sv=17500, eff=0.85), places=12)
+        np.testing.assert_allclose(sep.shell_thick(mawp), [sep.shell_thick(p) for p in mawp], rtol=1e-12)  # lists too
+
+    def test_weight_bare(self):
+        sep = SepTwoPhase(10, 40, 32, 5, LIQ, GAS)
+        thk = sep.shell_thick(np.array([[150.0, 300.0], [600.0, 900.0]]))
+        wgt = sep.weight_bare(thk)
+        self.assertEqual(wgt.shape, (2, 2))
+        for idx in np.ndindex(thk.shape):
+            self.assertAlmostEqual(wgt[idx] / sep.weight_bare(float(thk[idx])), 1, places=12)
+
+
+class TestNumpyScalarInputs(unittest.TestCase):
+    def test_two_phase(self):
+        ref = SepTwoPhase(10, 40, 32, 5, LIQ, GAS)
+        for vid, hliq in ((np.array(10.0), np.array(5.0)), (np.float64(10), np.float32(5)), (np.int64(10), 5.0)):
+            sep = SepTwoPhase(vid, 40, 32, hliq, LIQ, GAS)
+            for name in TWO_PHASE:
+                self.assertAlmostEqual(getattr(sep, name), getattr(ref, name), places=9, msg=name)
+
+    def test_three_phase(self):
+        ref = SepThreePhase(10, 40, 32, 7, 3, LIQ, WAT, GAS)
+        sep = SepThreePhase(np.array(10.0), 40, np.float64(32), np.array(7.0), np.int64(3), LIQ, WAT, GAS)
+        for name in ("aoil", "awat", "agas", "ret_oil", "ret_wat", "drop_oiw", "drop_wio", "drop_oig"):
+            self.assertAlmostEqual(getattr(sep, name), getattr(ref, name), places=9, msg=name)
+
+
+class TestTwoPhaseBatch(unittest.TestCase):
+    def assert_matches(self, res: dict, sep: SepTwoPhase, idx: tuple = ()) -> None:
+        for name in TWO_PHASE:
+            self.assertAlmostEqual(res[name][idx] / getattr(sep, name), 1, places=7, msg=name)
+
+    def test_scalar_inputs(self):
+        res = SepTwoPhase.batch(10, 32, 5, LIQ, GAS)
+        self.assertEqual(res["drop_liq"].shape, ())
+        self.assert_matches(res, SepTwoPhase(10, 40, 32, 5, LIQ, GAS))
+
+    def test_array_inputs(self):
+        vid = np.array([6.0, 8.0, 10.0])
+        res = SepTwoPhase.batch(vid, 32, 0.5 * vid, LIQ, GAS)
+        for i, d in enumerate(vid):
+            self.assert_matches(res, SepTwoPhase(d, 40, 32, 0.5 * d, LIQ, GAS), (i,))
+
+
+class TestThreePhaseSweep(unittest.TestCase):
+    def test_matches_constructor(self):
+        vid = np.array([[8.0], [10.0], [12.0]])
+        hoil = np.array([5.0, 6.0])
+        res = SepThreePhase.sweep(vid, 32, hoil, 3, LIQ, WAT, GAS)
+        self.assertEqual(res.shape, (3, 2))
+        for i, j in np.ndindex(res.shape):
+            sep = SepThreePhase(vid[i, 0], 40, 32, hoil[j], 3, LIQ, WAT, GAS)
+            for name in res.dtype.names:
+                self.assertAlmostEqual(res[name][i, j] / getattr(sep, name), 1, places=7, msg=name)
+
+
+class TestTerminalLigBatch(unittest.TestCase):
+    def test_matches_scalar(self):
+        sep = SepTwoPhase(10, 40, 32, 5, LIQ, GAS)
+        dm = np.array([[50.0, 100.0], [300.0, 1000.0]])
+        vt = sep.terminal_lig_batch(dm)
+        self.assertEqual(vt.shape, dm.shape)
+        for idx in np.ndindex(dm.shape):
+            self.assertAlmostEqual(vt[idx] / sep.terminal_lig(dm[idx]), 1, places=3)
+
+    def test_scalar_input(self):
+        sep = SepTwoPhase(10, 40, 32, 5, LIQ, GAS)
+        vt = sep.terminal_lig_batch(100)
+        self.assertEqual(vt.shape, ())
+        self.assertAlmostEqual(vt / sep.terminal_lig(100), 1, places=3)
+
+
+if __name__ == "__main__":
+    unittest.main()